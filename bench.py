@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# Micro benchmarks for gtkML internals. Run from the repository root:
+#
+#   python3 bench.py lookup
+#   python3 bench.py startup [runs]
+#   python3 bench.py windows [count]
+#   python3 bench.py properties
+#   python3 bench.py plan [rows]
+#   python3 bench.py instances [runs]
+#   python3 bench.py layout [fields]
+#   python3 bench.py binary [runs]      (GTKML_BINARY=dist/gtkml by default)
+#
+# The startup, windows, instances, layout and binary benchmarks need a display. startup and
+# binary launch the app repeatedly; without DISPLAY/WAYLAND_DISPLAY they wrap each run
+# in xvfb-run when that is installed;
+# GDK_BACKEND=broadway (with broadwayd running) works as well.
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from types import SimpleNamespace
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+MINIMAL_UI = """<gtkm><window title="bench"><label>bench</label></window></gtkm>"""
+
+
+def make_app(markup=MINIMAL_UI, **kwargs):
+    import main
+
+    tmp = tempfile.mkdtemp(prefix="gtkml-bench-")
+    os.environ.setdefault("XDG_CACHE_HOME", os.path.join(tmp, "cache"))
+    ui_path = os.path.join(tmp, "ui.gtkm")
+    with open(ui_path, "w", encoding="utf-8") as f:
+        f.write(markup)
+    return main.gtkMLApp(ui_path, **kwargs)
+
+
+def report(name, seconds, number):
+    print(f"{name:<40} {seconds / number * 1e9:>10.1f} ns/op")
+
+
+def bench_lookup():
+    for count in (10, 1_000, 100_000):
+        app = make_app()
+        for i in range(count):
+            app.apply_common_properties(SimpleNamespace(), {"id": f"widget{i}"})
+
+        last = f"widget{count - 1}"
+        number = 200_000
+        report(f"[{count} ids] exact-case hit", timeit.timeit(lambda: getattr(app, last), number=number), number)
+        report(f"[{count} ids] case-folded hit", timeit.timeit(lambda: getattr(app, last.upper()), number=number), number)
+        report(f"[{count} ids] miss (warning stub)", timeit.timeit(lambda: getattr(app, "noSuchWidget"), number=number), number)
+
+
+class StubWidget:
+    # records nothing; isolates gtkML's per-widget overhead from GTK's setters
+    def set_margin_top(self, value): pass
+    def set_margin_bottom(self, value): pass
+    def set_margin_start(self, value): pass
+    def set_margin_end(self, value): pass
+    def set_halign(self, value): pass
+    def set_hexpand(self, value): pass
+    def set_vexpand(self, value): pass
+    def set_spacing(self, value): pass
+    def set_wrap(self, value): pass
+    def add_css_class(self, name): pass
+
+
+def bench_properties(count=10_000):
+    import main
+
+    app = make_app()
+    markup = "".join(
+        f'<label margin="6" halign="start" hexpand="true" class="row dim-label" wrap="true">Row {i}</label>'
+        for i in range(count)
+    )
+    elements = list(main.parse_markup_lines(f"<vbox>{markup}</vbox>"))
+    widgets = [StubWidget() for _ in elements]
+    for element in elements:
+        app._props[element] = main.compile_properties(element.attrib)
+    label = app._get_widget_module("label")
+
+    def from_attrib():
+        for widget, element in zip(widgets, elements):
+            app.apply_common_properties(widget, element.attrib)
+
+    def precompiled():
+        for widget, element in zip(widgets, elements):
+            app.apply_common_properties(widget, element.attrib, app._props[element])
+
+    def typed():
+        for widget, element in zip(widgets, elements):
+            app.apply_common_properties(widget, element.attrib, app._element_props(element, "label", label))
+
+    for name, fn in (("attrib dict (parsed per widget)", from_attrib),
+                     ("pre-compiled props", precompiled),
+                     ("pre-compiled + typed attributes", typed)):
+        runs = 5
+        report(f"[{count} widgets] {name}", timeit.timeit(fn, number=runs), runs * count)
+
+
+def bench_plan(count=2000):
+    # cold: parse + compile every element's properties; warm: read_markup with the cached plan
+    import xml.etree.ElementTree as ET
+    import main
+
+    app = make_app(synthetic_markup(count))
+    with open(app.ui_path, "rb") as f:
+        data = f.read()
+
+    def cold():
+        for element in ET.fromstring(data).iter():
+            main.compile_properties(element.attrib)
+
+    main.write_plan(app.ui_path, ET.fromstring(data), data)
+
+    def warm():
+        app._props.clear()
+        app.read_markup(app.ui_path)
+
+    elements = sum(1 for _ in ET.fromstring(data).iter())
+    runs = 20
+    for name, fn in (("ET.fromstring + compile_properties", cold), ("read_markup with plan", warm)):
+        report(f"[{elements} elements] {name}", timeit.timeit(fn, number=runs), runs)
+
+
+def synthetic_markup(count):
+    rows = "\n".join(
+        f'<hbox spacing="6"><label halign="start">Row {i}</label><button>Edit</button></hbox>'
+        for i in range(count)
+    )
+    return f'<gtkm><window title="bench {count}"><scroll vexpand="true"><vbox>{rows}</vbox></scroll></window></gtkm>'
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def launch(app_dir, cache_dir, program=None):
+    fd, report_path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    program = program or [sys.executable, os.path.join(HERE, "main.py")]
+    cmd = program + [app_dir, f"--profile-startup={report_path}", "--exit-after-first-frame", "--new-instance"]
+    if not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY") or os.environ.get("GDK_BACKEND")):
+        if shutil.which("xvfb-run"):
+            cmd = ["xvfb-run", "-a"] + cmd
+    env = dict(os.environ, XDG_CACHE_HOME=cache_dir)
+    try:
+        subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=120, check=True)
+        with open(report_path, encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        os.unlink(report_path)
+
+
+def summarize(label, reports):
+    totals = [r["total_ms"] for r in reports]
+    print(f"{label:<28} p50 {percentile(totals, 50):>9.1f} ms   p95 {percentile(totals, 95):>9.1f} ms")
+    for name in [p["name"] for p in reports[0]["phases"]]:
+        durations = [p["duration_ms"] for r in reports for p in r["phases"] if p["name"] == name]
+        print(f"    {name:<24} p50 {percentile(durations, 50):>9.1f} ms   p95 {percentile(durations, 95):>9.1f} ms")
+
+
+def bench_startup(runs=10):
+    apps = [("example", os.path.join(HERE, "example"))]
+    for count in (100, 1_000, 5_000):
+        app_dir = tempfile.mkdtemp(prefix=f"gtkml-bench-{count}-")
+        with open(os.path.join(app_dir, "ui.gtkm"), "w", encoding="utf-8") as f:
+            f.write(synthetic_markup(count))
+        apps.append((f"synthetic x{count}", app_dir))
+
+    for label, app_dir in apps:
+        # cold: empty plan/bytecode caches every run; warm: caches primed once
+        cold = [launch(app_dir, tempfile.mkdtemp(prefix="gtkml-cold-")) for _ in range(runs)]
+        warm_cache = tempfile.mkdtemp(prefix="gtkml-warm-")
+        launch(app_dir, warm_cache)
+        warm = [launch(app_dir, warm_cache) for _ in range(runs)]
+        summarize(f"{label} (cold)", cold)
+        summarize(f"{label} (warm)", warm)
+
+
+def wall_ms(cmd, env):
+    start = time.perf_counter()
+    subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=120, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def bench_instances(runs=10):
+    # a fresh process per launch vs. forwarding to a running primary, which
+    # opens the window from its parsed template; both wait for the first frame.
+    # Needs a display and a session bus (e.g. run under dbus-run-session).
+    if not os.environ.get("DBUS_SESSION_BUS_ADDRESS"):
+        print("No session bus; run under dbus-run-session to compare launch paths")
+        return
+    app_dir = os.path.join(HERE, "example")
+    main_py = os.path.join(HERE, "main.py")
+    env = dict(os.environ, XDG_CACHE_HOME=tempfile.mkdtemp(prefix="gtkml-inst-"))
+
+    standalone = [wall_ms([sys.executable, main_py, app_dir, "--new-instance", "--exit-after-first-frame"], env)
+                  for _ in range(runs)]
+
+    fd, ready = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    os.unlink(ready)
+    primary = subprocess.Popen([sys.executable, main_py, app_dir, f"--profile-startup={ready}"], env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 60
+        while not os.path.exists(ready) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        forwarded = [wall_ms([sys.executable, main_py, app_dir], env) for _ in range(runs)]
+    finally:
+        primary.terminate()
+        primary.wait()
+        if os.path.exists(ready):
+            os.unlink(ready)
+
+    for label, timings in (("new process per launch", standalone), ("forwarded to primary", forwarded)):
+        print(f"{label:<28} p50 {percentile(timings, 50):>9.1f} ms   p95 {percentile(timings, 95):>9.1f} ms")
+
+
+def form_markup(fields, flat):
+    if flat:
+        cells = "".join(f'<label halign="start">Field {i}</label><entry hexpand="true"/>' for i in range(fields))
+        return f'<grid columns="2" spacing="6">{cells}</grid>'
+    # the nested hbox/vbox shape used by example/ui.gtkm
+    rows = "".join(
+        f'<hbox spacing="6"><vbox><label halign="start">Field {i}</label></vbox>'
+        f'<vbox hexpand="true"><hbox><entry hexpand="true"/></hbox></vbox></hbox>'
+        for i in range(fields)
+    )
+    return f'<vbox spacing="6">{rows}</vbox>'
+
+
+def bench_layout(fields=500):
+    # measure + allocate of the same form as nested boxes and as one grid;
+    # every widget's size cache is invalidated before each pass
+    from gi.repository import GLib, Gtk
+    import main
+
+    app = make_app()
+    variants = [("nested boxes", form_markup(fields, False)), ("grid", form_markup(fields, True))]
+    results = []
+
+    def descendants(widget):
+        out = [widget]
+        child = widget.get_first_child()
+        while child is not None:
+            out += descendants(child)
+            child = child.get_next_sibling()
+        return out
+
+    def run_variant():
+        if not variants:
+            app.app.quit()
+            return False
+        name, markup = variants.pop(0)
+        content = app.create_widget(main.parse_markup_lines(markup))
+        win = Gtk.Window(default_width=800, default_height=600)
+        win.set_child(Gtk.ScrolledWindow(child=content))
+        app.app.add_window(win)
+        start = time.perf_counter()
+        win.present()
+
+        def measure():
+            first_frame = (time.perf_counter() - start) * 1000
+            widgets = descendants(content)
+            passes = []
+            for _ in range(20):
+                for widget in widgets:
+                    widget.queue_resize()
+                t = time.perf_counter()
+                natural_w = content.measure(Gtk.Orientation.HORIZONTAL, -1)[1]
+                width = max(natural_w, 800)
+                natural_h = content.measure(Gtk.Orientation.VERTICAL, width)[1]
+                content.allocate(width, natural_h, -1, None)
+                passes.append((time.perf_counter() - t) * 1000)
+            results.append((name, len(widgets), first_frame, passes))
+            win.destroy()
+            GLib.idle_add(run_variant)
+
+        app.after_first_frame(win, measure)
+        return False
+
+    app.app.connect("activate", lambda *_: GLib.idle_add(run_variant))
+    app.app.run(None)
+
+    for name, count, first_frame, passes in results:
+        print(f"{f'{name} ({count} widgets)':<32} first frame {first_frame:>8.1f} ms   "
+              f"layout p50 {percentile(passes, 50):>7.2f} ms   p95 {percentile(passes, 95):>7.2f} ms")
+
+
+def bench_binary(runs=5):
+    # the example app from the source tree (widgets imported from bytecode)
+    # vs. the Nuitka binary (widgets compiled in); build.sh runs this after a build
+    binary = os.environ.get("GTKML_BINARY", os.path.join(HERE, "dist", "gtkml"))
+    if not os.path.exists(binary):
+        print(f"No binary at {binary}; run build.sh first")
+        return
+    app_dir = os.path.join(HERE, "example")
+    for label, program in (("source (main.py)", None), ("binary", [binary])):
+        cache = tempfile.mkdtemp(prefix="gtkml-bin-")
+        launch(app_dir, cache, program)
+        summarize(label, [launch(app_dir, cache, program) for _ in range(runs)])
+
+
+def bench_windows(count=20):
+    from gi.repository import GLib
+
+    parse_start = time.perf_counter()
+    app = make_app(synthetic_markup(500))
+    parse_ms = (time.perf_counter() - parse_start) * 1000
+    timings = []
+
+    def open_windows():
+        for _ in range(count):
+            start = time.perf_counter()
+            app.open_window()
+            timings.append((time.perf_counter() - start) * 1000)
+        app.app.quit()
+        return False
+
+    app.app.connect("activate", lambda *_: GLib.idle_add(open_windows))
+    app.app.run(None)
+
+    print(f"{'parse + app setup (once)':<28} {parse_ms:>9.1f} ms")
+    print(f"{'window 2':<28} {timings[0]:>9.1f} ms")
+    print(f"{f'windows 2..{count + 1}':<28} p50 {percentile(timings, 50):>9.1f} ms   p95 {percentile(timings, 95):>9.1f} ms")
+
+
+BENCHMARKS = {
+    "lookup": bench_lookup,
+    "startup": bench_startup,
+    "windows": bench_windows,
+    "properties": bench_properties,
+    "plan": bench_plan,
+    "instances": bench_instances,
+    "layout": bench_layout,
+    "binary": bench_binary,
+}
+
+if __name__ == "__main__":
+    names = [a for a in sys.argv[1:] if not a.isdigit()]
+    numbers = [int(a) for a in sys.argv[1:] if a.isdigit()]
+    for name in names or list(BENCHMARKS):
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark '{name}'. Available: {', '.join(BENCHMARKS)}")
+            sys.exit(1)
+        print(f"== {name}")
+        if numbers and name in ("startup", "windows", "instances", "layout", "binary", "plan"):
+            BENCHMARKS[name](numbers[0])
+        else:
+            BENCHMARKS[name]()
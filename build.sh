@@ -20,6 +20,10 @@ pip install nuitka pycairo PyGObject
 
 export NUITKA_FORCE_DATA_FILES=1
 
+# Bundle the example (markup, plan, CSS, images, logic bytecode) into one
+# .gresource; the binary mmaps it instead of extracting loose files
+python3 "$BASE_DIR/main.py" --bundle "$BASE_DIR/example"
+
 DATA_ARGS=""
 
 add_dir_recursive() {
@@ -33,9 +37,8 @@ add_dir_recursive() {
     fi
 }
 
-add_dir_recursive "$BASE_DIR/widgets" "widgets"
 add_dir_recursive "$BASE_DIR/assets" "assets"
-add_dir_recursive "$BASE_DIR/example" "example"
+DATA_ARGS="$DATA_ARGS --include-data-file=$BASE_DIR/example/app.gresource=example/app.gresource"
 
 NUITKA_OPTIMIZATION_LEVEL=3 python3 -m nuitka \
     --onefile \
@@ -46,6 +49,7 @@ NUITKA_OPTIMIZATION_LEVEL=3 python3 -m nuitka \
     --python-flag=no_docstrings \
     --assume-yes-for-downloads \
     --nofollow-import-to=tests,unittest \
+    --include-package=widgets \
     --noinclude-default-mode=error \
     --output-dir="$OUTPUT_DIR" \
     --output-filename="$APP_NAME" \
@@ -54,3 +58,9 @@ NUITKA_OPTIMIZATION_LEVEL=3 python3 -m nuitka \
 
 echo
 echo "Build complete: $OUTPUT_DIR/$APP_NAME"
+
+# Startup of the example app, source tree vs. the binary (needs a display or xvfb-run)
+if [ -n "$DISPLAY$WAYLAND_DISPLAY" ] || command -v xvfb-run >/dev/null 2>&1; then
+    echo
+    GTKML_BINARY="$BASE_DIR/$OUTPUT_DIR/$APP_NAME" python3 "$BASE_DIR/bench.py" binary 5
+fi
@@ -6,12 +6,6 @@ def cancel(widget):
     sys.exit(0)
 
 def showSource(widget):
-    try:
-        with open(app.ui_path, "r", encoding="utf-8") as f:
-            sourceCode = f.read()
-        buffer = app.sourceTextView.get_buffer()
-        buffer.set_text(sourceCode)
-    except Exception as e:
-        app.warn(f"Could not open source file: {e}")
-    buffer = app.sourceTextView.get_buffer()
-    buffer.set_text(sourceCode)
+    app.sourceTextView.get_buffer().set_text("")
+    app.load_text(app.sourceTextView, app.ui_path)
+
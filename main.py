@@ -1,17 +1,69 @@
 #!/usr/bin/env python3
+import time
+_STARTUP_T0 = time.monotonic()
 import sys
 import os
+import stat
 import json
+import hashlib
+import pickle
+import marshal
+import atexit
+import threading
+import weakref
+import codecs
+import tracemalloc
+from contextlib import contextmanager
+from collections import OrderedDict, deque
+from types import SimpleNamespace, ModuleType
+from array import array
 import xml.etree.ElementTree as ET
+from xml.parsers import expat
 import importlib.util
 import importlib
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("GdkPixbuf", "2.0")
-from gi.repository import Gtk, Gio, Gdk, GdkPixbuf  # noqa: E402
+from gi.repository import Gtk, Gio, Gdk, GdkPixbuf, GLib, GObject  # noqa: E402
+
+_STARTUP_GI_DONE = time.monotonic()
+
+try:
+    import widgets as builtin_widgets
+    BUILTIN_WIDGETS = frozenset(builtin_widgets.BUILTIN)
+    BUILTIN_WIDGETS_DIR = os.path.dirname(os.path.realpath(builtin_widgets.__file__))
+except ImportError:
+    BUILTIN_WIDGETS = frozenset()
+    BUILTIN_WIDGETS_DIR = None
 
 DEFAULT_APP_ID = "com.zerostormy.gtkml"
+APP_FLAGS = Gio.ApplicationFlags.HANDLES_COMMAND_LINE | Gio.ApplicationFlags.HANDLES_OPEN
+RESOURCE_PREFIX = "/gtkml/app"
+BUNDLE_NAME = "app.gresource"
+PLAN_VERSION = 7
+PLAN_SUFFIX = ".gtkmc"
+
+TRUTHY = ("1", "true", "yes", "on")
+CO_COROUTINE = 0x80  # inspect.CO_COROUTINE, without importing inspect
+# markup tags handled by main.py itself rather than by a widget module
+STRUCTURAL_TAGS = frozenset(("gtkm", "head", "script", "window", "headerbar", "menu", "tab", "column"))
+
+MARGIN_KEYS = {
+    "margin": ("top", "bottom", "start", "end"),
+    "margin-top": ("top",),
+    "margin-bottom": ("bottom",),
+    "margin-start": ("start",),
+    "margin-end": ("end",),
+}
+
+ALIGN_MAP = {
+    "fill": Gtk.Align.FILL,
+    "start": Gtk.Align.START,
+    "center": Gtk.Align.CENTER,
+    "end": Gtk.Align.END,
+}
+ALIGN_BY_VALUE = {int(v): v for v in ALIGN_MAP.values()}
 
 def log(message):
     print(f"[gtkML:LOG] {message}")
@@ -22,19 +74,1306 @@ def warn(message):
 def error(message):
     print(f"[gtkML:ERROR] {message}")
 
+def truthy(val):
+    return str(val).lower() in TRUTHY
+
+def cli_args():
+    # positional arguments only; "--flag" style options are handled in __main__
+    return [a for a in sys.argv[1:] if not a.startswith("--")]
+
+def cli_flags():
+    # "--name" -> True, "--name=value" -> "value"
+    flags = {}
+    for arg in sys.argv[1:]:
+        if arg.startswith("--"):
+            name, sep, value = arg.partition("=")
+            flags[name] = value if sep else True
+    return flags
+
+
+class StartupTimer:
+    # monotonic timestamps for each launch phase, relative to the first line of main.py
+    def __init__(self, t0):
+        self.t0 = t0
+        self.phases = []
+        self.finished = False
+
+    def add(self, name, start, end):
+        if not self.finished:
+            self.phases.append((name, start, end))
+
+    @contextmanager
+    def phase(self, name):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add(name, start, time.monotonic())
+
+    def report(self):
+        phases = [
+            {
+                "name": name,
+                "start_ms": round((start - self.t0) * 1000, 3),
+                "end_ms": round((end - self.t0) * 1000, 3),
+                "duration_ms": round((end - start) * 1000, 3),
+            }
+            for name, start, end in self.phases
+        ]
+        return {
+            "pid": os.getpid(),
+            "phases": phases,
+            "total_ms": phases[-1]["end_ms"] if phases else 0.0,
+        }
+
+
+STARTUP = StartupTimer(_STARTUP_T0)
+STARTUP.add("import_gi", _STARTUP_T0, _STARTUP_GI_DONE)
+
 def detect_app_root():
     if getattr(sys, "frozen", False) or getattr(sys, "compiled", False):
         base_dir = os.path.dirname(sys.executable)
     else:
         base_dir = os.path.dirname(os.path.abspath(__file__))
-    if len(sys.argv) > 1:
-        app_root = os.path.abspath(sys.argv[1])
+    args = cli_args()
+    if args:
+        app_root = os.path.abspath(args[0])
     else:
         example_dir = os.path.join(base_dir, "example")
         app_root = example_dir if os.path.exists(example_dir) else base_dir
     return app_root
 
-APP_ROOT = detect_app_root()
+with STARTUP.phase("detect_app_root"):
+    APP_ROOT = detect_app_root()
+
+
+class PlanElement(ET.Element):
+    # element from parse_markup_lines; remembers the source line it came from
+    line = None
+
+
+def parse_markup_lines(data):
+    # same tree as ET.fromstring, but every element remembers its source line
+    builder = ET.TreeBuilder(element_factory=PlanElement)
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+
+    def start(tag, attrs):
+        builder.start(tag, attrs).line = parser.CurrentLineNumber
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = builder.end
+    parser.CharacterDataHandler = builder.data
+    parser.Parse(data, True)
+    return builder.close()
+
+
+class WidgetProfiler:
+    def __init__(self):
+        self.calls = {}
+        self.lines = {}
+        self.total = {}
+        self.folded = {}
+        self.resolve = {}
+        self.registry_scan = 0.0
+        self._stack = []
+
+    def resolved(self, tag, seconds, found):
+        self.resolve[tag] = (seconds, found)
+
+    def enter(self, tag, element):
+        line = getattr(element, "line", None)
+        self.calls[tag] = self.calls.get(tag, 0) + 1
+        key = (tag, line)
+        self.lines[key] = self.lines.get(key, 0) + 1
+        path = f"{self._stack[-1][0]};{tag}" if self._stack else tag
+        # [path, start, time spent in nested create_widget calls]
+        self._stack.append([path, time.perf_counter(), 0.0])
+
+    def leave(self):
+        path, start, children = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        tag = path.rsplit(";", 1)[-1]
+        self.total[tag] = self.total.get(tag, 0.0) + elapsed
+        self.folded[path] = self.folded.get(path, 0.0) + elapsed - children
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    def report(self, out=None):
+        out = out or sys.stdout
+        print("[gtkML:PROFILE] create_widget calls per tag (inclusive create() time):", file=out)
+        for tag, count in sorted(self.calls.items(), key=lambda kv: -self.total.get(kv[0], 0.0)):
+            print(f"  {tag:<16} {count:>8} calls {self.total.get(tag, 0.0) * 1000:>10.3f} ms", file=out)
+        print("[gtkML:PROFILE] create_widget calls per source line:", file=out)
+        for (tag, line), count in sorted(self.lines.items(), key=lambda kv: (-kv[1], kv[0][1] or 0)):
+            where = f"line {line}" if line else "line ?"
+            print(f"  {where:<10} <{tag}> x{count}", file=out)
+        print(f"[gtkML:PROFILE] widget registry scan: {self.registry_scan * 1000:.3f} ms; module resolution:", file=out)
+        for tag, (seconds, found) in sorted(self.resolve.items(), key=lambda kv: -kv[1][0]):
+            print(f"  {tag:<16} {seconds * 1000:>10.3f} ms{'' if found else '  (no handler, cached)'}", file=out)
+        print("[gtkML:PROFILE] folded stacks (self time, us):", file=out)
+        for path, seconds in sorted(self.folded.items()):
+            print(f"{path} {int(seconds * 1e6)}", file=out)
+
+
+def compile_properties(attrib):
+    attrib = {k.lower(): v for k, v in attrib.items()}
+    props = {}
+
+    for key, sides in MARGIN_KEYS.items():
+        if key in attrib:
+            try:
+                value = int(attrib[key])
+            except (TypeError, ValueError):
+                continue
+            for side in sides:
+                props[f"margin_{side}"] = value
+
+    if "spacing" in attrib:
+        try:
+            props["spacing"] = int(attrib["spacing"])
+        except (TypeError, ValueError):
+            pass
+
+    for key in ("halign", "valign"):
+        align = ALIGN_MAP.get(attrib.get(key, "").lower())
+        if align is not None:
+            props[key] = align
+
+    if "expand" in attrib:
+        props["hexpand"] = props["vexpand"] = truthy(attrib["expand"])
+    if "hexpand" in attrib:
+        props["hexpand"] = truthy(attrib["hexpand"])
+    if "vexpand" in attrib:
+        props["vexpand"] = truthy(attrib["vexpand"])
+
+    if "disabled" in attrib and truthy(attrib["disabled"]):
+        props["sensitive"] = False
+    elif "enabled" in attrib:
+        props["sensitive"] = truthy(attrib["enabled"])
+
+    classes = []
+    if "class" in attrib:
+        classes += attrib["class"].split()
+    if "classes" in attrib:
+        classes += attrib["classes"].split()
+    if classes:
+        props["classes"] = classes
+
+    if "id" in attrib:
+        props["id"] = attrib["id"]
+    if "field" in attrib:
+        props["field"] = attrib["field"]
+
+    # attr="{model.key}" binds the attribute to an observable model
+    bindings = []
+    for key, value in attrib.items():
+        value = value.strip()
+        if len(value) > 2 and value[0] == "{" and value[-1] == "}":
+            model, _, path = value[1:-1].strip().partition(".")
+            if model and path:
+                bindings.append((key, model, path))
+    if bindings:
+        props["bind"] = bindings
+    return props
+
+
+ATTRIBUTE_TYPES = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": truthy,
+    "align": lambda value: ALIGN_MAP[value.lower()],
+}
+
+
+def compile_attribute_spec(declared):
+    # widget modules declare ATTRIBUTES = {"wrap": "bool", "max-chars": ("int", "max_width_chars")};
+    # each entry becomes (attribute, parser, property) and the property is applied via set_<property>
+    spec = []
+    for attr, kind in (declared or {}).items():
+        if isinstance(kind, (tuple, list)):
+            kind, prop = kind
+        else:
+            prop = attr.replace("-", "_")
+        parser = ATTRIBUTE_TYPES.get(kind, kind) if isinstance(kind, str) else kind
+        if not callable(parser):
+            warn(f"Unknown attribute type '{kind}' for '{attr}'")
+            continue
+        spec.append((attr.lower(), parser, prop))
+    return spec
+
+
+def compile_typed_properties(attrib, spec, props):
+    typed = dict(props)
+    attrib = {k.lower(): v for k, v in attrib.items()}
+    for attr, parser, prop in spec:
+        if attr in attrib:
+            try:
+                typed[prop] = parser(attrib[attr])
+            except (TypeError, ValueError, KeyError):
+                warn(f"Invalid value for {attr}: {attrib[attr]!r}")
+    return typed
+
+
+def scan_markup_head(root):
+    app_info = {}
+    script = None
+    for child in root.iter():
+        tag = child.tag.lower()
+        if tag == "head":
+            for meta in child:
+                app_info[meta.tag.lower()] = (meta.text or "").strip()
+        elif tag == "script" and child.attrib.get("src"):
+            script = dict(child.attrib)
+    return app_info, script
+
+
+class MarkupStream:
+    # incremental reader over a .gtkm file: collects <head>/<script> metadata and
+    # hands out the window's top-level children as soon as each one is complete
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, path, plan_props=None, props=None):
+        # plan_props: the cached plan's property dicts in document order, stored
+        # into props as each element starts
+        self.path = path
+        self.root = None
+        self.window = None
+        self.app_info = {}
+        self.script = None
+        self.done = False
+        self._file = open(path, "rb")
+        # the plan written after streaming needs the file's identity, not its bytes
+        self.stat = os.fstat(self._file.fileno())
+        self.digest = hashlib.sha256() if plan_props is None else None
+        self._plan_props = plan_props
+        self._props = props
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._depth = 0
+        self._window_depth = None
+        self._ready = deque()
+
+    def _pump(self):
+        data = self._file.read(self.CHUNK_SIZE)
+        if data:
+            if self.digest is not None:
+                self.digest.update(data)
+            self._parser.feed(data)
+        else:
+            self._parser.close()
+            self._file.close()
+            self.done = True
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                self._depth += 1
+                if self._plan_props is not None:
+                    props = next(self._plan_props, None)
+                    if props is not None:
+                        self._props[elem] = props
+                if self.root is None:
+                    self.root = elem
+                if self.window is None and elem.tag.lower() == "window" and self._depth <= 2:
+                    self.window = elem
+                    self._window_depth = self._depth
+                continue
+
+            tag = elem.tag.lower()
+            if self._window_depth is not None and self._depth == self._window_depth + 1:
+                self._ready.append(elem)
+            elif self._depth == self._window_depth:
+                self._window_depth = None
+            if tag == "head":
+                for meta in elem:
+                    self.app_info[meta.tag.lower()] = (meta.text or "").strip()
+            elif tag == "script" and elem.attrib.get("src"):
+                self.script = dict(elem.attrib)
+            self._depth -= 1
+
+    def read_until_window(self):
+        while self.window is None and not self.done:
+            self._pump()
+        if self.window is None:
+            raise ValueError("Markup must contain a <window> element")
+
+    def next_child(self):
+        while not self._ready and not self.done:
+            self._pump()
+        return self._ready.popleft() if self._ready else None
+
+
+def plan_cache_paths(ui_path):
+    # a plan shipped next to the source wins over the per-user cache copy
+    ui_path = os.path.abspath(ui_path)
+    local = os.path.splitext(ui_path)[0] + PLAN_SUFFIX
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    key = hashlib.sha1(ui_path.encode("utf-8")).hexdigest()
+    return [local, os.path.join(cache_home, "gtkml", "plans", key + PLAN_SUFFIX)]
+
+
+def scan_widget_dirs(dirs):
+    # one scandir per directory; earlier directories win for the same tag
+    files = {}
+    for d in dirs:
+        try:
+            with os.scandir(d) as it:
+                for entry in it:
+                    if entry.name.endswith(".py") and not entry.name.startswith("_"):
+                        files.setdefault(entry.name[:-3].lower(), entry.path)
+        except OSError:
+            continue
+    return files
+
+
+def compile_markup(ui_path, widget_dirs=None, data=None, root=None, digest=None, st=None):
+    # a plan holds no tree: the C parser rebuilds that faster than any Python
+    # loop could. It stores the compiled properties of every element, as a
+    # table of distinct property dicts plus one index per element in
+    # document order (root.iter()), so a warm launch skips compile_properties.
+    if data is None and (root is None or digest is None):
+        with open(ui_path, "rb") as f:
+            data = f.read()
+    if root is None:
+        try:
+            root = ET.fromstring(data)
+        except ET.ParseError as e:
+            raise RuntimeError(f"Failed to parse UI file '{ui_path}': {e}")
+
+    window = root if root.tag.lower() == "window" else next(
+        (child for child in root if child.tag.lower() == "window"), None)
+    if window is None:
+        raise ValueError("Markup must contain a <window> element")
+
+    app_info, script = scan_markup_head(root)
+
+    # properties only depend on the attributes, so each distinct set is compiled once
+    table = []
+    seen = {}
+    index = array("I")
+    tags = set()
+    for elem in root.iter():
+        key = tuple(elem.attrib.items())
+        i = seen.get(key)
+        if i is None:
+            props = compile_properties(elem.attrib)
+            for name in ("halign", "valign"):
+                if name in props:
+                    props[name] = int(props[name])
+            i = seen[key] = len(table)
+            table.append(props)
+        index.append(i)
+        tags.add(elem.tag.lower())
+
+    # only widget tags are recorded; <head> children are metadata
+    tags -= STRUCTURAL_TAGS
+    tags.difference_update(meta.tag.lower() for head in root.iter("head") for meta in head)
+    if widget_dirs is not None:
+        known = set(scan_widget_dirs(widget_dirs)) | BUILTIN_WIDGETS
+        for tag in sorted(tags - known):
+            warn(f"No widget handler for <{tag}> (compiled anyway)")
+
+    st = st or os.stat(ui_path)
+    return {
+        "version": PLAN_VERSION,
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "hash": digest or hashlib.sha256(data).hexdigest(),
+        "app_info": app_info,
+        "script": script,
+        "tags": sorted(tags),
+        "props": table,
+        "index": index,
+    }
+
+
+def save_plan(plan, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(plan, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def load_plan(ui_path, data=None, st=None, check_content=True):
+    try:
+        st = st or os.stat(ui_path)
+    except OSError:
+        return None
+
+    for path in plan_cache_paths(ui_path):
+        try:
+            with open(path, "rb") as f:
+                plan = pickle.load(f)
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            warn(f"Ignoring unreadable UI plan '{path}': {e}")
+            continue
+
+        if not isinstance(plan, dict) or plan.get("version") != PLAN_VERSION:
+            continue
+        if plan.get("mtime_ns") == st.st_mtime_ns and plan.get("size") == st.st_size:
+            return plan
+        if not check_content:
+            continue
+        # mtimes do not survive copies (e.g. onefile extraction), so fall back to the content hash
+        if data is None:
+            with open(ui_path, "rb") as f:
+                data = f.read()
+        if plan.get("hash") == hashlib.sha256(data).hexdigest():
+            return plan
+    return None
+
+
+def write_plan(ui_path, root, data=None, digest=None, st=None):
+    plan = compile_markup(ui_path, data=data, root=root, digest=digest, st=st)
+    save_plan(plan, plan_cache_paths(ui_path)[-1])
+
+
+class Diagnostics:
+    # opt-in memory diagnostics: live widget counts per tag (GObject weak refs,
+    # so they track the real objects rather than Python wrappers), tracemalloc
+    # snapshot diffs and a check for destroyed widgets still held in app.widgets
+    def __init__(self, app):
+        self.app = app
+        self.created = {}
+        self.alive = {}
+        self._snapshot = None
+        self._service = None
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+
+    def track(self, tag, widget):
+        self.created[tag] = self.created.get(tag, 0) + 1
+        self.alive[tag] = self.alive.get(tag, 0) + 1
+
+        def on_finalize(*_args):
+            self.alive[tag] -= 1
+
+        def on_destroy(w):
+            w._gtkml_destroyed = True
+
+        try:
+            widget.weak_ref(on_finalize)
+            widget.connect("destroy", on_destroy)
+        except Exception:
+            pass
+
+    def counts(self):
+        lines = ["live widgets per tag (alive / created):"]
+        for tag in sorted(self.created, key=lambda t: -self.alive.get(t, 0)):
+            lines.append(f"  {tag:<16} {self.alive.get(tag, 0):>8} / {self.created[tag]}")
+        return "\n".join(lines)
+
+    def leaks(self):
+        found = []
+        scopes = list(self.app._scopes.values()) or [self.app.scope]
+        for scope in scopes:
+            for wid, widget in scope.widgets.items():
+                if getattr(widget, "_gtkml_destroyed", False):
+                    found.append(f"  '{wid}': destroyed but still referenced from app.widgets")
+                elif widget.get_parent() is None and widget.get_root() is None:
+                    found.append(f"  '{wid}': detached from any window but still referenced from app.widgets")
+        return "\n".join(["suspected leaks:"] + (found or ["  none"]))
+
+    def snapshot(self, limit=15):
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        previous, self._snapshot = self._snapshot, snapshot
+        if previous is None:
+            current, peak = tracemalloc.get_traced_memory()
+            return f"tracemalloc baseline taken ({current / 1024:.1f} KiB traced, peak {peak / 1024:.1f} KiB)"
+        lines = [f"top {limit} allocation changes since the previous snapshot:"]
+        for diff in snapshot.compare_to(previous, "lineno")[:limit]:
+            lines.append(f"  {diff}")
+        return "\n".join(lines)
+
+    def command(self, name):
+        name = name.strip().lower()
+        if name == "counts":
+            return self.counts()
+        if name == "leaks":
+            return self.leaks()
+        if name == "snapshot":
+            return self.snapshot()
+        if name in ("", "report"):
+            return "\n".join((self.counts(), self.leaks(), self.snapshot()))
+        return f"unknown command '{name}' (counts, leaks, snapshot, report)"
+
+    def serve(self, path):
+        # one command per connection over a unix socket, e.g.
+        #   echo snapshot | socat - UNIX-CONNECT:/tmp/gtkml.sock
+        try:
+            # only a stale socket from an earlier run is replaced, never a regular file
+            try:
+                if stat.S_ISSOCK(os.lstat(path).st_mode):
+                    os.unlink(path)
+            except FileNotFoundError:
+                pass
+            self._service = Gio.SocketService()
+            # the socket exposes app internals: owner-only from the moment it is bound
+            umask = os.umask(0o077)
+            try:
+                self._service.add_address(Gio.UnixSocketAddress.new(path), Gio.SocketType.STREAM,
+                                          Gio.SocketProtocol.DEFAULT, None)
+            finally:
+                os.umask(umask)
+            os.chmod(path, 0o600)
+            self._service.connect("incoming", self._on_incoming)
+            self._service.start()
+            log(f"Diagnostics listening on {path}")
+        except Exception as e:
+            warn(f"Could not open diagnostics socket '{path}': {e}")
+
+    def _on_incoming(self, _service, connection, _source):
+        try:
+            stream = Gio.DataInputStream.new(connection.get_input_stream())
+            line, _length = stream.read_line_utf8(None)
+            reply = self.command(line or "") + "\n"
+            connection.get_output_stream().write_all(reply.encode("utf-8"), None)
+            connection.close(None)
+        except Exception as e:
+            warn(f"Diagnostics command failed: {e}")
+        return True
+
+
+PROBE_CHUNK_SIZE = 4096
+
+
+class TextureCache:
+    # process-wide LRU of decoded textures keyed by (path, mtime, target size),
+    # bounded by an approximate byte budget (4 bytes per pixel)
+    def __init__(self, budget_bytes, max_workers=4):
+        self.budget_bytes = budget_bytes
+        self.max_workers = max(1, max_workers)
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._pool = None
+
+    def probe(self, path):
+        # header-only read; returns (width, height) or (None, None)
+        if is_resource(path):
+            return self._probe_resource(path)
+        try:
+            fmt, width, height = GdkPixbuf.Pixbuf.get_file_info(path)
+        except Exception:
+            return None, None
+        if fmt is None or not width or not height:
+            return None, None
+        return width, height
+
+    def _probe_resource(self, path):
+        # get_file_info needs a file: feed the mmapped bytes to a loader in small
+        # slices and stop at size-prepared, before any pixels are decoded
+        size = []
+
+        def on_size_prepared(loader, width, height):
+            size.append((width, height))
+            loader.set_size(1, 1)
+
+        try:
+            data = Gio.resources_lookup_data(resource_path(path), Gio.ResourceLookupFlags.NONE)
+        except GLib.Error:
+            return None, None
+        loader = GdkPixbuf.PixbufLoader()
+        loader.connect("size-prepared", on_size_prepared)
+        try:
+            total = data.get_size()
+            for offset in range(0, total, PROBE_CHUNK_SIZE):
+                loader.write_bytes(GLib.Bytes.new_from_bytes(data, offset, min(PROBE_CHUNK_SIZE, total - offset)))
+                if size:
+                    break
+        except GLib.Error:
+            pass
+        finally:
+            try:
+                loader.close()
+            except GLib.Error:
+                # expected: the image was cut short on purpose
+                pass
+        return size[0] if size else (None, None)
+
+    def _key(self, path, width, height):
+        # bundled resources are immutable for the life of the process
+        mtime = 0 if is_resource(path) else os.stat(path).st_mtime_ns
+        return (path, mtime, width, height)
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _insert(self, key, texture):
+        nbytes = texture.get_width() * texture.get_height() * 4
+        replaced = self._entries.pop(key, None)
+        if replaced is not None:
+            self.size_bytes -= replaced[1]
+        self._entries[key] = (texture, nbytes)
+        self.size_bytes += nbytes
+        while self.size_bytes > self.budget_bytes and len(self._entries) > 1:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size_bytes -= evicted
+
+    def load(self, path, width=None, height=None):
+        key = self._key(path, width, height)
+        texture = self._lookup(key)
+        if texture is not None:
+            return texture
+
+        self.misses += 1
+        if (width and height) or is_resource(path):
+            texture = Gdk.Texture.new_for_pixbuf(self._decode_pixbuf(path, width, height))
+        else:
+            texture = Gdk.Texture.new_from_filename(path)
+        self._insert(key, texture)
+        return texture
+
+    def _decode_pixbuf(self, path, width, height):
+        if is_resource(path):
+            if width and height:
+                return GdkPixbuf.Pixbuf.new_from_resource_at_scale(resource_path(path), width, height, True)
+            return GdkPixbuf.Pixbuf.new_from_resource(resource_path(path))
+        if width and height:
+            return GdkPixbuf.Pixbuf.new_from_file_at_size(path, width, height)
+        return GdkPixbuf.Pixbuf.new_from_file(path)
+
+    def load_async(self, path, width, height, callback):
+        # decodes on a bounded worker pool and calls callback(texture or None)
+        # on the main loop; returns a function that cancels the request
+        key = self._key(path, width, height)
+        texture = self._lookup(key)
+        if texture is not None:
+            callback(texture)
+            return lambda: None
+
+        pending = self._pending.get(key)
+        if pending is None:
+            self.misses += 1
+            if self._pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="gtkml-img")
+            pending = self._pending[key] = [None, []]
+            pending[0] = self._pool.submit(self._decode, key)
+        pending[1].append(callback)
+
+        def cancel():
+            if callback in pending[1]:
+                pending[1].remove(callback)
+            if not pending[1] and pending[0].cancel():
+                self._pending.pop(key, None)
+        return cancel
+
+    def _decode(self, key):
+        # worker thread: only GdkPixbuf work here, textures are made on the main loop
+        path, _mtime, width, height = key
+        try:
+            pixbuf = self._decode_pixbuf(path, width, height)
+            GLib.idle_add(self._finish, key, pixbuf, None)
+        except Exception as e:
+            GLib.idle_add(self._finish, key, None, e)
+
+    def _finish(self, key, pixbuf, err):
+        _future, callbacks = self._pending.pop(key, (None, []))
+        texture = None
+        if pixbuf is not None:
+            # a synchronous load() of the same key may have finished first; share its texture
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                texture = entry[0]
+            else:
+                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+                self._insert(key, texture)
+        elif callbacks:
+            warn(f"Could not load image '{key[0]}': {err}")
+        for callback in callbacks:
+            callback(texture)
+        return False
+
+    def clear(self):
+        self._entries.clear()
+        self.size_bytes = 0
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self._pending.clear()
+
+
+try:
+    _texture_budget = int(os.environ.get("GTKML_TEXTURE_BUDGET_MB", "64")) * 1024 * 1024
+except ValueError:
+    _texture_budget = 64 * 1024 * 1024
+try:
+    _image_workers = int(os.environ.get("GTKML_IMAGE_WORKERS", "4"))
+except ValueError:
+    _image_workers = 4
+TEXTURES = TextureCache(_texture_budget, _image_workers)
+
+try:
+    STREAM_THRESHOLD = int(float(os.environ.get("GTKML_STREAM_THRESHOLD_MB", "4")) * 1024 * 1024)
+except ValueError:
+    STREAM_THRESHOLD = 4 * 1024 * 1024
+STREAM_SLICE_SECONDS = 0.008
+
+TEXT_CHUNK_SIZE = 64 * 1024
+
+try:
+    BACKGROUND_WORKERS = max(1, int(os.environ.get("GTKML_BACKGROUND_WORKERS", "4")))
+except ValueError:
+    BACKGROUND_WORKERS = 4
+
+
+class TextFeed:
+    # streams text into a Gtk.TextView: files are read with Gio async I/O in
+    # chunks, inserts go to the end iter in budgeted idle slices, and max_lines
+    # trims from the start so a followed log behaves like a ring buffer
+    def __init__(self, view, max_lines=None, follow=False):
+        self.view = view
+        self.buffer = view.get_buffer()
+        self.max_lines = max_lines
+        self.follow = follow
+        self.pending = deque()
+        self._source = 0
+        self._file = None
+        self._stream = None
+        self._monitor = None
+        self._cancel = None
+        self._decoder = None
+        self._reading = False
+        self._eof = False
+        self._end = self.buffer.create_mark(None, self.buffer.get_end_iter(), False)
+        view.connect("destroy", lambda *_: self.close())
+
+    def append(self, text):
+        if not text:
+            return
+        self.pending.append(text)
+        if not self._source:
+            self._source = GLib.idle_add(self._flush)
+
+    def _flush(self):
+        deadline = time.perf_counter() + STREAM_SLICE_SECONDS
+        buffer = self.buffer
+        while self.pending:
+            buffer.insert(buffer.get_end_iter(), self.pending.popleft())
+            if time.perf_counter() >= deadline:
+                break
+        self._trim()
+        if self.follow:
+            self.view.scroll_to_mark(self._end, 0.0, False, 0.0, 1.0)
+
+        # reads are paced by inserts so a huge file never sits in Python memory
+        if self._stream is not None and not self._reading and not self._eof and len(self.pending) < 4:
+            self._read_next()
+        if self.pending:
+            return True
+        self._source = 0
+        return False
+
+    def _trim(self):
+        if not self.max_lines:
+            return
+        excess = self.buffer.get_line_count() - self.max_lines
+        if excess > 0:
+            _found, end = self.buffer.get_iter_at_line(excess)
+            self.buffer.delete(self.buffer.get_start_iter(), end)
+
+    def load(self, path):
+        # path may also be a resource:// URI into the app bundle
+        self.close()
+        self._file = Gio.File.new_for_uri(path) if is_resource(path) else Gio.File.new_for_path(path)
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self._cancel = Gio.Cancellable()
+        self._reading = True
+        self._eof = False
+        self._file.read_async(GLib.PRIORITY_DEFAULT, self._cancel, self._on_open)
+
+    def _on_open(self, file, result):
+        self._reading = False
+        try:
+            self._stream = file.read_finish(result)
+        except GLib.Error as e:
+            if not e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                warn(f"Cannot open '{file.get_parse_name()}': {e.message}")
+            return
+        self._read_next()
+
+    def _read_next(self):
+        self._reading = True
+        self._stream.read_bytes_async(TEXT_CHUNK_SIZE, GLib.PRIORITY_DEFAULT, self._cancel, self._on_read)
+
+    def _on_read(self, stream, result):
+        self._reading = False
+        try:
+            data = stream.read_bytes_finish(result).get_data()
+        except GLib.Error as e:
+            if not e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                warn(f"Read failed for '{self._file.get_parse_name()}': {e.message}")
+            return
+
+        if data:
+            self._eof = False
+            self.append(self._decoder.decode(data))
+            if len(self.pending) < 4:
+                self._read_next()
+            return
+
+        self._eof = True
+        if self.follow and self._monitor is None and self._file.has_uri_scheme("file"):
+            try:
+                self._monitor = self._file.monitor_file(Gio.FileMonitorFlags.NONE, None)
+                self._monitor.connect("changed", self._on_file_changed)
+            except Exception as e:
+                warn(f"Cannot follow '{self._file.get_parse_name()}': {e}")
+
+    def _on_file_changed(self, _monitor, _file, _other, event):
+        if event != Gio.FileMonitorEvent.CHANGED or self._stream is None or self._reading:
+            return
+        try:
+            # truncated (e.g. logrotate copytruncate): start over from the top
+            size = self._file.query_info("standard::size", Gio.FileQueryInfoFlags.NONE, None).get_size()
+            if size < self._stream.tell():
+                self._stream.seek(0, GLib.SeekType.SET, None)
+        except Exception:
+            pass
+        self._read_next()
+
+    def close(self):
+        if self._cancel is not None:
+            self._cancel.cancel()
+        if self._monitor is not None:
+            self._monitor.cancel()
+        if self._stream is not None:
+            try:
+                self._stream.close(None)
+            except Exception:
+                pass
+        if self._source:
+            GLib.source_remove(self._source)
+            self._source = 0
+        self.pending.clear()
+        self._cancel = self._monitor = self._stream = self._file = None
+        self._reading = False
+
+
+class ListRow(GObject.Object):
+    # wraps one row of logic-provided data so it can live in a Gio.ListStore
+    __gtype_name__ = "GtkmlListRow"
+
+    def __init__(self, data):
+        super().__init__()
+        self.data = data
+
+
+def row_value(data, field):
+    if isinstance(data, dict):
+        return data.get(field)
+    if isinstance(data, (list, tuple)):
+        try:
+            return data[int(field)]
+        except (ValueError, IndexError):
+            return None
+    return getattr(data, field, None)
+
+
+def set_widget_value(widget, value):
+    widget = getattr(widget, "_inner_switch", widget)
+    if isinstance(widget, (Gtk.CheckButton, Gtk.Switch, Gtk.ToggleButton)):
+        widget.set_active(bool(value))
+    elif isinstance(widget, Gtk.Picture):
+        widget.set_paintable(TEXTURES.load(value) if value else None)
+    elif isinstance(widget, Gtk.Image):
+        widget.set_from_icon_name(value)
+    elif isinstance(widget, Gtk.TextView):
+        widget.get_buffer().set_text("" if value is None else str(value))
+    elif hasattr(widget, "set_label"):
+        widget.set_label("" if value is None else str(value))
+    elif hasattr(widget, "set_text"):
+        widget.set_text("" if value is None else str(value))
+
+
+class Model:
+    # observable attribute bag exposed to logic code as app.model(name);
+    # writes are only queued here and reach bound widgets on the next flush
+    def __init__(self, app, name):
+        object.__setattr__(self, "_app", app)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_values", {})
+
+    def __getattr__(self, key):
+        if key.startswith("__"):
+            raise AttributeError(key)
+        return self._values.get(key)
+
+    def __setattr__(self, key, value):
+        self._values[key] = value
+        self._app.mark_dirty(self._name, key)
+
+    def update(self, **values):
+        for key, value in values.items():
+            setattr(self, key, value)
+
+    def get(self, path):
+        key, _, rest = path.partition(".")
+        value = self._values.get(key)
+        for part in rest.split(".") if rest else ():
+            value = row_value(value, part)
+        return value
+
+
+def apply_bound_value(widget, attr, value):
+    if attr in ("text", "value"):
+        set_widget_value(widget, value)
+        return
+    setter = getattr(widget, "set_" + attr.replace("-", "_"), None)
+    if callable(setter):
+        setter(value)
+
+
+class BuildScheduler:
+    # time-sliced construction for <window progressive="true">: once the current
+    # slice is over budget, create_widget hands back a placeholder and queues the
+    # element; idle slices then build queued elements, mapped (visible) ones first
+    def __init__(self, app, budget_ms=4.0, on_progress=None):
+        self.app = app
+        self.budget = budget_ms / 1000.0
+        self.on_progress = on_progress
+        self.queue = deque()
+        self.active = False
+        self.current = None
+        self.built = 0
+        self._deadline = 0.0
+        self._source = 0
+
+    def start_slice(self):
+        self._deadline = time.perf_counter() + self.budget
+
+    def should_defer(self, element):
+        return self.active and element is not self.current and time.perf_counter() >= self._deadline
+
+    def defer(self, element):
+        placeholder = Gtk.Box()
+        props = self.app._props.get(element) or compile_properties(element.attrib)
+        for key in ("hexpand", "vexpand"):
+            if key in props:
+                getattr(placeholder, f"set_{key}")(props[key])
+        self.queue.append((element, placeholder))
+        self.kick()
+        return placeholder
+
+    def kick(self):
+        if self.queue and not self._source:
+            self._source = GLib.idle_add(self._run_slice)
+
+    def _next(self):
+        # a short scan keeps this cheap while still preferring what is on screen
+        for i, (element, placeholder) in enumerate(self.queue):
+            if i >= 64:
+                break
+            if placeholder.get_mapped():
+                del self.queue[i]
+                return element, placeholder
+        return self.queue.popleft()
+
+    def _run_slice(self):
+        self.start_slice()
+        self.active = True
+        try:
+            while self.queue:
+                self._materialize(*self._next())
+                if time.perf_counter() >= self._deadline:
+                    break
+        finally:
+            self.active = False
+
+        if self.on_progress:
+            try:
+                self.on_progress(self.built, len(self.queue))
+            except Exception as e:
+                self.app.warn(f"Progress handler failed: {e}")
+        if self.queue:
+            return True
+        self._source = 0
+        return False
+
+    def _materialize(self, element, placeholder):
+        parent = placeholder.get_parent()
+        if parent is None:
+            # the placeholder was discarded (e.g. an unloaded notebook page)
+            return
+        scope = self.app._scope_for_widget(placeholder)
+        if scope is not None and scope is not self.app.scope:
+            self.app._activate_scope(scope)
+
+        self.current = element
+        try:
+            widget = self.app.create_widget(element)
+        finally:
+            self.current = None
+        self.built += 1
+
+        if isinstance(parent, Gtk.Box):
+            if widget:
+                parent.insert_child_after(widget, placeholder)
+            parent.remove(placeholder)
+        elif isinstance(parent, Gtk.Grid):
+            col, row, width, height = parent.query_child(placeholder)
+            parent.remove(placeholder)
+            if widget:
+                parent.attach(widget, col, row, width, height)
+        elif isinstance(parent, Gtk.CenterBox):
+            for slot in ("start", "center", "end"):
+                if getattr(parent, f"get_{slot}_widget")() is placeholder:
+                    getattr(parent, f"set_{slot}_widget")(widget)
+        elif hasattr(parent, "set_child"):
+            # ScrolledWindow.set_child wrapped the placeholder in a Viewport; hand the
+            # real widget to the ScrolledWindow so scrollable ones (list/column/text
+            # views) keep their own scrolling and virtualization
+            if isinstance(parent, Gtk.Viewport) and isinstance(parent.get_parent(), Gtk.ScrolledWindow):
+                parent = parent.get_parent()
+            parent.set_child(widget)
+
+
+class RateLimitedHandler:
+    # debounce: one call after events have been quiet for `debounce` ms;
+    # throttle: a leading call, then at most one per `throttle` ms with the
+    # latest arguments. Either way one GLib timeout per widget is pending,
+    # not one per event.
+    def __init__(self, handler, debounce=0, throttle=0):
+        self.handler = handler
+        self.debounce = max(0, debounce)
+        self.throttle = max(0, throttle)
+        self._args = None
+        self._last = 0.0
+        self._source = 0
+
+    def __call__(self, *args):
+        self._args = args
+        self._last = time.monotonic()
+        if self.debounce:
+            if not self._source:
+                self._source = GLib.timeout_add(self.debounce, self._fire_debounced)
+        elif not self._source:
+            self._args = None
+            self._source = GLib.timeout_add(self.throttle, self._fire_throttled)
+            self.handler(*args)
+
+    def _fire_debounced(self):
+        remaining = self.debounce - int((time.monotonic() - self._last) * 1000)
+        if remaining > 0:
+            # events kept coming; re-arm once for the rest of the quiet period
+            self._source = GLib.timeout_add(remaining, self._fire_debounced)
+            return False
+        self._source = 0
+        self.flush()
+        return False
+
+    def _fire_throttled(self):
+        if self._args is None:
+            self._source = 0
+            return False
+        self.flush()
+        return True
+
+    def flush(self):
+        args, self._args = self._args, None
+        if args is not None:
+            self.handler(*args)
+
+    def cancel(self):
+        if self._source:
+            GLib.source_remove(self._source)
+            self._source = 0
+        self._args = None
+
+
+class WindowScope:
+    # per-window widget namespace; every window is stamped from the same parsed template
+    def __init__(self, track_elements=False):
+        self.window = None
+        self.widgets = {}
+        # lower-cased id -> widget, kept in step with widgets for __getattr__
+        self.index = {}
+        # element -> built widget, only tracked in --watch mode for reload diffing
+        self.element_widgets = {} if track_elements else None
+        # background jobs and async handler tasks started from this window
+        self.futures = set()
+        self.tasks = set()
+        self.closed = False
+
+    def cancel_jobs(self):
+        self.closed = True
+        for future in list(self.futures):
+            future.cancel()
+        for task in list(self.tasks):
+            task.cancel()
+
+
+class DeferredLogic:
+    # stands in for logic.py until it is loaded after the first frame; handlers
+    # looked up now are trampolines that call into the real module later
+    def __init__(self, app):
+        self._app = app
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        def trampoline(*args, **kwargs):
+            logic = self._app.logic
+            if logic is None or isinstance(logic, DeferredLogic):
+                self._app.warn(f"Logic not loaded yet; dropped call to {name}")
+                return None
+            handler = getattr(logic, name, None)
+            if not callable(handler):
+                self._app.warn(f"No such handler in logic.py: {name}")
+                return None
+            return handler(*args, **kwargs)
+        trampoline.__name__ = name
+        return trampoline
+
+
+def is_resource(path):
+    return isinstance(path, str) and path.startswith("resource://")
+
+
+def resource_path(uri):
+    return uri[len("resource://"):]
+
+
+def read_resource(uri):
+    return Gio.resources_lookup_data(resource_path(uri), Gio.ResourceLookupFlags.NONE).get_data()
+
+
+class AppBundle:
+    # an app's files compiled into one .gresource by --bundle; Gio.Resource.load
+    # mmaps it and the file list is indexed once, so lookups need no stat calls
+    def __init__(self, path, app_dir):
+        self.path = path
+        self.app_dir = app_dir
+        self.resource = Gio.Resource.load(path)
+        Gio.resources_register(self.resource)
+        self.names = set(self._walk(""))
+
+    def _walk(self, rel):
+        base = f"{RESOURCE_PREFIX}/{rel}"
+        for child in self.resource.enumerate_children(base, Gio.ResourceLookupFlags.NONE):
+            if child.endswith("/"):
+                yield from self._walk(rel + child)
+            else:
+                yield rel + child
+
+    def lookup(self, path):
+        # resource:// URI of the bundled copy of path (relative to the app dir), or None
+        if not path:
+            return None
+        if is_resource(path):
+            return path
+        if os.path.isabs(path):
+            path = os.path.relpath(path, self.app_dir)
+        rel = os.path.normpath(path).replace(os.sep, "/")
+        if rel in self.names:
+            return f"resource://{RESOURCE_PREFIX}/{rel}"
+        return None
+
+    def newer_source(self, mtime_ns):
+        # first loose file of the bundle modified after mtime_ns (generated plans
+        # and bytecode have no loose copy and are skipped)
+        for rel in self.names:
+            try:
+                if os.stat(os.path.join(self.app_dir, rel)).st_mtime_ns > mtime_ns:
+                    return os.path.join(self.app_dir, rel)
+            except OSError:
+                pass
+        return None
+
+    def close(self):
+        Gio.resources_unregister(self.resource)
+
+    def has(self, uri):
+        return resource_path(uri)[len(RESOURCE_PREFIX) + 1:] in self.names
+
+    def code(self, uri, filename):
+        # bundled bytecode (<name>.pyc next to the source) when it matches this Python
+        compiled = f"{uri}c"
+        if self.has(compiled):
+            data = read_resource(compiled)
+            magic = importlib.util.MAGIC_NUMBER
+            if data.startswith(magic):
+                return marshal.loads(data[len(magic):])
+        return compile(read_resource(uri), filename, "exec")
+
+    def plan(self, uri):
+        compiled = f"{uri}c"
+        if not self.has(compiled):
+            return None
+        try:
+            plan = pickle.loads(read_resource(compiled))
+        except Exception as e:
+            warn(f"Ignoring unreadable bundled plan: {e}")
+            return None
+        return plan if isinstance(plan, dict) and plan.get("version") == PLAN_VERSION else None
+
+
+def find_bundle(app_dir):
+    path = os.path.join(app_dir, BUNDLE_NAME)
+    try:
+        st = os.stat(path)
+        bundle = AppBundle(path, app_dir)
+    except OSError:
+        return None
+    except GLib.Error as e:
+        warn(f"Could not load bundle '{path}': {e.message}")
+        return None
+    # in a source checkout any bundled file edited after bundling wins over the stale bundle
+    if not getattr(sys, "frozen", False):
+        newer = bundle.newer_source(st.st_mtime_ns)
+        if newer:
+            warn(f"{path} is older than {newer}; ignoring it (re-run --bundle)")
+            bundle.close()
+            return None
+    return bundle
+
+
+def load_code_cached(path):
+    # compile a source file once; the code object is cached under
+    # $XDG_CACHE_HOME/gtkml/bytecode, keyed by path, mtime and size
+    st = os.stat(path)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    key = hashlib.sha1(os.path.realpath(path).encode("utf-8")).hexdigest()
+    cache_path = os.path.join(cache_home, "gtkml", "bytecode", key + ".pyc")
+    header = importlib.util.MAGIC_NUMBER + f"{st.st_mtime_ns}:{st.st_size}\n".encode("ascii")
+
+    try:
+        with open(cache_path, "rb") as f:
+            data = f.read()
+        if data.startswith(header):
+            return marshal.loads(data[len(header):])
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+
+    with open(path, "rb") as f:
+        code = compile(f.read(), path, "exec")
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(header + marshal.dumps(code))
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass
+    return code
+
 
 class gtkMLApp:
     def log(self, message):
@@ -47,16 +1386,15 @@ class gtkMLApp:
         print(f"[gtkML:ERROR] {message}")
 
     def __getattr__(self, name):
+        # only reached on a normal attribute miss; exact-case ids are real attributes
         try:
-            widgets = object.__getattribute__(self, "widgets")
-        except Exception:
-            widgets = {}
+            index = object.__getattribute__(self, "_widget_index")
+        except AttributeError:
+            index = {}
 
-        if isinstance(widgets, dict):
-            lname = name.lower()
-            for key, widget in widgets.items():
-                if key and key.lower() == lname:
-                    return widget
+        widget = index.get(name.lower())
+        if widget is not None:
+            return widget
 
         if name.startswith("Gtk_"):
             return getattr(Gtk, name[4:], None)
@@ -71,15 +1409,31 @@ class gtkMLApp:
         if window and hasattr(window, name):
             return getattr(window, name)
 
-        def missing(*args, **kwargs):
-            try:
-                self.warn(f"Attempted to call unknown function or attribute: {name} (args={args}, kwargs={kwargs})")
-            except Exception:
-                print(f"[gtkML:WARN] Attempted to call unknown function or attribute: {name} (args={args}, kwargs={kwargs})")
-            return None
-        return missing
+        try:
+            strict = object.__getattribute__(self, "strict")
+        except AttributeError:
+            strict = False
+        if strict:
+            raise AttributeError(f"gtkML app has no widget or attribute '{name}'")
+
+        try:
+            stubs = object.__getattribute__(self, "_missing_stubs")
+        except AttributeError:
+            stubs = {}
+        stub = stubs.get(name)
+        if stub is None:
+            def stub(*args, **kwargs):
+                try:
+                    self.warn(f"Attempted to call unknown function or attribute: {name} (args={args}, kwargs={kwargs})")
+                except Exception:
+                    print(f"[gtkML:WARN] Attempted to call unknown function or attribute: {name} (args={args}, kwargs={kwargs})")
+                return None
+            stubs[name] = stub
+        return stub
 
-    def __init__(self, ui_path, logic_path=None, widgets_dir=None, application_id=None):
+    def __init__(self, ui_path, logic_path=None, widgets_dir=None, application_id=None, profile=None, watch=False,
+                 strict=None, defer_logic=False, startup_report=None, exit_after_first_frame=False,
+                 diagnostics=None, stream=None, application=None, bundle=None):
         ui_path = os.path.abspath(ui_path)
         self.ui_path = ui_path
         self.app_dir = os.path.dirname(self.ui_path)
@@ -98,76 +1452,287 @@ class gtkMLApp:
             self.widgets_dir = next((d for d in candidate_dirs if os.path.isdir(d)), candidate_dirs[0])
 
 
-        self.widgets = {}
+        self._scopes = {}
+        self._activate_scope(WindowScope(watch))
+        self._missing_stubs = {}
+        self.strict = truthy(os.environ.get("GTKML_STRICT", "")) if strict is None else strict
         self.app_info = {}
         self.logic = None
+        self._logic_modules = {}
+        self._deferred_logic_path = None
+        self.defer_logic = defer_logic
+        # None streams files above GTKML_STREAM_THRESHOLD_MB that have no cached plan
+        self.stream = stream
+        self._stream = None
+        # AppBundle from --bundle; bundled files are preferred over loose ones
+        self.bundle = bundle
+        self._stream_script = None
+        self._stream_target = None
+        self._scheduler = None
+        # True prints the startup JSON report, a string writes it to that path
+        self.startup_report = startup_report
+        self.exit_after_first_frame = exit_after_first_frame
         self._widget_module_cache = {}
-
-        app_id = application_id or DEFAULT_APP_ID
-        self.app = Gtk.Application(application_id=app_id)
+        self._attribute_specs = {}
+        self._property_ops = {}
+        # compiled common properties per markup element (filled from the plan,
+        # or lazily by create_widget), and the typed variants for modules with ATTRIBUTES
+        self._props = {}
+        self._typed_props = {}
+        self._pending_plan = None
+        self._registered_widgets = {}
+        self._missing_widgets = set()
+        self._widget_files = {}
+        self._entry_points = None
+        self.textures = TEXTURES
+        self.list_models = {}
+        self._field_sink = None
+        self.models = {}
+        # (model, top-level key) -> [(weakref to widget, attr, path)]
+        self._bindings = {}
+        self._dirty = set()
+        self._dirty_lock = threading.Lock()
+        self._flush_queued = False
+        self._aio_loop = None
+        self._aio_pump = 0
+        self._tasks = set()
+        self._thread_pool = None
+        self._process_pool = None
+        self._futures = set()
+        self.background_stats = {"submitted": 0, "completed": 0, "failed": 0, "cancelled": 0,
+                                 "queue_depth": 0, "max_queue_depth": 0}
+        self.css_path = None
+        self.css_provider = None
+        self.logic_path = None
+        self.watching = watch
+        self._monitors = {}
+        self._reload_sources = {}
+
+        if profile is None:
+            profile = truthy(os.environ.get("GTKML_PROFILE", ""))
+        self.profiler = WidgetProfiler() if profile else None
+        if self.profiler:
+            atexit.register(self.profiler.report)
+
+        if diagnostics is None:
+            diagnostics = truthy(os.environ.get("GTKML_DIAGNOSTICS", ""))
+        self.diagnostics = Diagnostics(self) if diagnostics else None
+        if self.diagnostics and os.environ.get("GTKML_DEBUG_SOCKET"):
+            self.diagnostics.serve(os.environ["GTKML_DEBUG_SOCKET"])
+
+        self.scan_widget_dirs()
+
+        if application is None:
+            application = Gtk.Application(application_id=application_id or DEFAULT_APP_ID, flags=APP_FLAGS)
+        self.app = application
         self.app.connect("activate", self.on_activate)
+        self.app.connect("command-line", self.on_command_line)
+        self.app.connect("open", self.on_open)
+        self.app.connect("shutdown", lambda *_: self.cancel_background())
+        self.app.connect("window-removed", self._on_window_removed)
         self.root = self.parse_markup(self.ui_path)
+        self.template = None
 
         if logic_path:
-            self.logic = self.load_logic_module(logic_path)
-
-    def load_logic_module(self, path):
+            # the <script> file passed explicitly (as __main__ does) keeps its defer="true"
+            pending = self._deferred_logic_path
+            defer = self.defer_logic or (pending is not None and os.path.abspath(pending) == os.path.abspath(logic_path))
+            self.use_logic(logic_path, defer)
+
+    def use_logic(self, path, defer=False):
+        if not defer:
+            self._deferred_logic_path = None
+            self.logic = self.load_logic_module(path)
+            return
+        # handlers resolve through DeferredLogic until the first frame is painted
+        self._deferred_logic_path = path
+        if not isinstance(self.logic, DeferredLogic):
+            self.logic = DeferredLogic(self)
+
+    def load_deferred_logic(self):
+        path, self._deferred_logic_path = self._deferred_logic_path, None
+        if path:
+            self.logic = self.load_logic_module(path)
+            if self.logic:
+                self.logic.app = self
+        return False
+
+    def load_logic_module(self, path, force=False):
         path = os.path.abspath(path)
-        if not os.path.exists(path):
+        bundled = self.bundle.lookup(path) if self.bundle else None
+        if not bundled and not os.path.exists(path):
             self.warn(f"Logic file not found: {path}")
             return None
 
+        key = os.path.realpath(path)
+        if not force and key in self._logic_modules:
+            return self._logic_modules[key]
+
         spec = importlib.util.spec_from_file_location("gtkml_logic_module", path)
         module = importlib.util.module_from_spec(spec)
 
-        import gi as _gi
-        _gi.require_version("Gtk", "4.0")
-        _gi.require_version("Gio", "2.0")
-        _gi.require_version("Gdk", "4.0")
-        _gi.require_version("GdkPixbuf", "2.0")
-        from gi.repository import Gtk as _Gtk, Gio as _Gio, Gdk as _Gdk, GdkPixbuf as _GdkPixbuf
-
-        module.Gtk = _Gtk
-        module.Gio = _Gio
-        module.Gdk = _Gdk
-        module.GdkPixbuf = _GdkPixbuf
+        module.Gtk = Gtk
+        module.Gio = Gio
+        module.Gdk = Gdk
+        module.GdkPixbuf = GdkPixbuf
+        module.register_widget = self.register_widget
 
         sys.modules["gtkml_logic_module"] = module
         try:
-            spec.loader.exec_module(module)
+            with STARTUP.phase("logic_import"):
+                code = self.bundle.code(bundled, path) if bundled else load_code_cached(path)
+                exec(code, module.__dict__)
         except Exception as e:
             self.warn(f"Failed to load logic module '{path}': {e}")
             return None
 
         module.app = self
+        self.logic_path = path
+        self._logic_modules[key] = module
         return module
 
-    def parse_markup(self, file_path):
+    def read_markup(self, file_path):
         try:
-            tree = ET.parse(file_path)
+            with open(file_path, "rb") as f:
+                data = f.read()
+                st = os.fstat(f.fileno())
+            # the profiler reports source lines, which only parse_markup_lines records
+            root = parse_markup_lines(data) if self.profiler else ET.fromstring(data)
         except Exception as e:
             raise RuntimeError(f"Failed to parse UI file '{file_path}': {e}")
 
-        root = tree.getroot()
-        self.app_info = {}
+        plan = load_plan(file_path, data, st)
+        if plan is not None:
+            self._apply_plan(root, plan)
+            self._preload_widget_modules(plan["tags"])
+            return root, dict(plan["app_info"]), plan["script"]
+
+        app_info, script = scan_markup_head(root)
+        # compiled and saved from a worker once the window is up (_write_pending_plan)
+        self._pending_plan = (file_path, root, {"data": data, "st": st})
+        return root, app_info, script
+
+    def _read_bundled_markup(self, uri):
+        root = ET.fromstring(read_resource(uri))
+        plan = self.bundle.plan(uri)
+        if plan is not None:
+            self._apply_plan(root, plan)
+            return root, dict(plan["app_info"]), plan["script"]
+        app_info, script = scan_markup_head(root)
+        return root, app_info, script
+
+    def _plan_props(self, plan):
+        # the plan's property dict for each element, in document order; the
+        # distinct dicts are shared between elements and must not be mutated
+        table = plan["props"]
+        for props in table:
+            for key in ("halign", "valign"):
+                if key in props:
+                    props[key] = ALIGN_BY_VALUE[props[key]]
+        return map(table.__getitem__, plan["index"])
+
+    def _apply_plan(self, root, plan):
+        self._props.update(zip(root.iter(), self._plan_props(plan)))
+
+    def _write_pending_plan(self):
+        if self._pending_plan is None:
+            return False
+        file_path, root, source = self._pending_plan
+        self._pending_plan = None
+        # best effort: a failure here only costs the next launch its compile_properties
+        self.run_in_background(lambda: write_plan(file_path, root, **source), scoped=False,
+                               on_error=lambda e: self.log(f"Could not cache UI plan for '{file_path}': {e}"))
+        return False
 
-        logic_path = None
-        for child in list(tree.iter()):
-            tag = child.tag.lower()
-            if tag == "head":
-                for meta in child:
-                    self.app_info[meta.tag.lower()] = (meta.text or "").strip()
-            elif tag == "script" and child.attrib.get("src"):
-                src = child.attrib["src"]
-                candidate = os.path.join(self.app_dir, src)
-                if os.path.exists(candidate):
-                    logic_path = candidate
+    def parse_markup(self, file_path):
+        with STARTUP.phase("parse_markup"):
+            bundled = self.bundle.lookup(file_path) if self.bundle else None
+            if bundled:
+                root, self.app_info, script = self._read_bundled_markup(bundled)
+            elif self._should_stream(file_path):
+                # only <head> and the <window> start tag are read here; the
+                # window's children are parsed while build_ui builds them
+                # stat-only plan check: hashing would mean reading the whole file up front
+                plan = load_plan(file_path, check_content=False)
+                if plan is not None:
+                    self._preload_widget_modules(plan["tags"])
+                    self._stream = MarkupStream(file_path, self._plan_props(plan), self._props)
                 else:
-                    logic_path = src
-        if logic_path:
-            self.logic = self.load_logic_module(logic_path)
+                    self._stream = MarkupStream(file_path)
+                self._stream.read_until_window()
+                root, self.app_info, script = self._stream.root, self._stream.app_info, self._stream.script
+                self._stream_script = script
+            else:
+                root, self.app_info, script = self.read_markup(file_path)
+
+        if script:
+            self._use_script(script)
+        elif self._stream is not None:
+            # a <script> may still come later in the stream; bind handlers lazily until then
+            self.logic = DeferredLogic(self)
         return root
 
+    def _use_script(self, script):
+        src = script["src"]
+        candidate = os.path.join(self.app_dir, src)
+        bundled = self.bundle is not None and self.bundle.lookup(candidate)
+        logic_path = candidate if bundled or os.path.exists(candidate) else src
+        self.use_logic(logic_path, self.defer_logic or truthy(script.get("defer", "")))
+
+    def _should_stream(self, file_path):
+        if self.stream is not None:
+            return self.stream
+        try:
+            return os.path.getsize(file_path) >= STREAM_THRESHOLD
+        except OSError:
+            return False
+
+    def _build_streamed(self, win, vbox):
+        # build top-level children until roughly a screenful is there; the rest
+        # is parsed and built in idle slices after the window is presented
+        self._stream_target = (win, vbox)
+        _width, height = win.get_default_size()
+        while self._stream_step(win, vbox):
+            if vbox.measure(Gtk.Orientation.VERTICAL, -1)[1] >= height:
+                GLib.idle_add(self._stream_slice, win, vbox)
+                break
+
+    def _stream_slice(self, win, vbox):
+        deadline = time.perf_counter() + STREAM_SLICE_SECONDS
+        while self._stream is not None and time.perf_counter() < deadline:
+            if not self._stream_step(win, vbox):
+                return False
+        return self._stream is not None
+
+    def _stream_step(self, win, vbox):
+        stream = self._stream
+        element = stream.next_child()
+        if element is not None:
+            if element.tag.lower() == "headerbar":
+                headerbar = self.create_headerbar(element)
+                if headerbar:
+                    win.set_titlebar(headerbar)
+            else:
+                widget = self.create_widget(element)
+                if widget:
+                    vbox.append(widget)
+
+        if stream.script and stream.script is not self._stream_script:
+            self._stream_script = stream.script
+            self._use_script(stream.script)
+        if element is not None:
+            return True
+
+        self._stream = self._stream_target = None
+        self.app_info.update(stream.app_info)
+        if isinstance(self.logic, DeferredLogic) and not self._deferred_logic_path:
+            self.logic = None
+        if stream.digest is not None:
+            # the streamed tree is complete now; the plan is compiled from it off the main loop
+            self._pending_plan = (stream.path, stream.root, {"digest": stream.digest.hexdigest(), "st": stream.stat})
+            self._write_pending_plan()
+        return False
+
     def load_css(self, css_path):
         if css_path:
             if not os.path.isabs(css_path):
@@ -177,48 +1742,145 @@ class gtkMLApp:
             if css_path and not os.path.isabs(css_path):
                 css_path = os.path.join(self.app_dir, css_path)
 
-        if not css_path or not os.path.exists(css_path):
+        bundled = self.bundle.lookup(css_path) if self.bundle else None
+        if not bundled and (not css_path or not os.path.exists(css_path)):
             self.warn(f"CSS not found or not provided: {css_path}")
             return
 
         try:
-            provider = Gtk.CssProvider()
-            provider.load_from_path(css_path)
-            display = Gdk.Display.get_default()
-            Gtk.StyleContext.add_provider_for_display(display, provider, Gtk.STYLE_PROVIDER_PRIORITY_USER)
+            # reuse the provider so a reload swaps the stylesheet in place
+            provider = self.css_provider or Gtk.CssProvider()
+            if bundled:
+                provider.load_from_resource(resource_path(bundled))
+            else:
+                provider.load_from_path(css_path)
+            if self.css_provider is None:
+                display = Gdk.Display.get_default()
+                Gtk.StyleContext.add_provider_for_display(display, provider, Gtk.STYLE_PROVIDER_PRIORITY_USER)
+                self.css_provider = provider
+            self.css_path = css_path
         except Exception as e:
             self.warn(f"Could not load CSS '{css_path}': {e}")
 
+    def _activate_scope(self, scope):
+        # app.<id>, self.widgets and self.window all follow the current scope;
+        # exact-case ids are plain instance attributes of the current scope only
+        previous = self.__dict__.get("scope")
+        if previous is not None and previous is not scope:
+            for wid, widget in previous.widgets.items():
+                if self.__dict__.get(wid) is widget:
+                    del self.__dict__[wid]
+            for wid, widget in scope.widgets.items():
+                try:
+                    setattr(self, wid, widget)
+                except Exception:
+                    pass
+        self.scope = scope
+        self.widgets = scope.widgets
+        self._widget_index = scope.index
+        self._element_widgets = scope.element_widgets
+        self.window = scope.window
+
+    def _scope_for_widget(self, widget):
+        try:
+            return self._scopes.get(widget.get_root())
+        except Exception:
+            return None
+
+    def _on_window_active(self, win, _pspec):
+        scope = self._scopes.get(win)
+        if scope is not None and win.is_active() and scope is not self.scope:
+            self._activate_scope(scope)
+
+    def _on_window_removed(self, _application, win):
+        scope = self._scopes.pop(win, None)
+        if scope is not None:
+            scope.cancel_jobs()
+        if scope is self.scope:
+            remaining = next(iter(self._scopes.values()), None)
+            self._activate_scope(remaining or WindowScope(self.watching))
+
+    def get_template(self):
+        if self.template is None:
+            if self.root.tag.lower() == "gtkm":
+                window_elem = next((child for child in self.root if child.tag.lower() == "window"), None)
+            else:
+                window_elem = self.root
+
+            if window_elem is None or window_elem.tag.lower() != "window":
+                raise ValueError("Markup must contain a <window> element")
+            self.template = self.root = window_elem
+        return self.template
+
     def build_ui(self):
         if self.logic:
             setattr(self.logic, "app", self)
 
-        if self.root.tag.lower() == "gtkm":
-            window_elem = next((child for child in self.root if child.tag.lower() == "window"), None)
-        else:
-            window_elem = self.root
-
-        if window_elem is None or window_elem.tag.lower() != "window":
-            raise ValueError("Markup must contain a <window> element")
-
-        self.root = window_elem
+        template = self.get_template()
+        scope = self.scope if self.scope.window is None else WindowScope(self.watching)
+        self._activate_scope(scope)
 
         win = Gtk.ApplicationWindow(application=self.app)
-        win.set_title(self.root.attrib.get("title") or self.app_info.get("program_name", "gtkML Application"))
+        scope.window = self.window = win
+        self._scopes[win] = scope
+        win.set_title(template.attrib.get("title") or self.app_info.get("program_name", "gtkML Application"))
         win.set_default_size(640, 480)
 
-        for element in self.root:
-            if element.tag.lower() == "headerbar":
-                headerbar = self.create_headerbar(element)
-                if headerbar:
-                    win.set_titlebar(headerbar)
-                break
+        if self._stream is not None and len(self._scopes) == 1:
+            # headerbar and contents arrive through the stream
+            vbox = self.build_content([])
+            win.set_child(vbox)
+            self._build_streamed(win, vbox)
+        else:
+            while self._stream is not None:
+                # another window needs the complete template
+                self._stream_step(*self._stream_target)
+
+            for element in template:
+                if element.tag.lower() == "headerbar":
+                    headerbar = self.create_headerbar(element)
+                    if headerbar:
+                        win.set_titlebar(headerbar)
+                    break
+
+            scheduler = self._progressive_scheduler(template)
+            if scheduler is None:
+                win.set_child(self.build_content(template))
+            else:
+                scheduler.start_slice()
+                scheduler.active = True
+                try:
+                    win.set_child(self.build_content(template))
+                finally:
+                    scheduler.active = False
+        win.connect("notify::is-active", self._on_window_active)
+        return win
 
+    def _progressive_scheduler(self, template):
+        if not truthy(template.attrib.get("progressive", "")):
+            return None
+        if self._scheduler is None:
+            try:
+                budget = float(template.attrib.get("budget", "4"))
+            except ValueError:
+                budget = 4.0
+            self._scheduler = BuildScheduler(self, budget, self.get_handler(template.attrib.get("onprogress")))
+        return self._scheduler
+
+    def open_window(self):
+        # stamp another window from the already parsed template; textures, CSS
+        # and widget modules are shared, only widgets are created
+        win = self.build_ui()
+        self.app.add_window(win)
+        win.present()
+        return win
+
+    def build_content(self, window_elem):
         vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         vbox.set_hexpand(True)
         vbox.set_vexpand(True)
 
-        for element in self.root:
+        for element in window_elem:
             if element.tag.lower() == "headerbar":
                 continue
             widget = self.create_widget(element)
@@ -230,10 +1892,191 @@ class gtkMLApp:
                         vbox.add(widget)
                     except Exception:
                         pass
+        return vbox
 
-        win.set_child(vbox)
-        self.window = win
-        return win
+    def after_first_frame(self, win, callback):
+        clock = win.get_frame_clock()
+        if clock is None:
+            GLib.idle_add(callback)
+            return
+
+        def on_after_paint(frame_clock):
+            frame_clock.disconnect(handler_id)
+            GLib.idle_add(callback)
+
+        handler_id = clock.connect("after-paint", on_after_paint)
+
+    def watch_files(self, paths):
+        for path in paths:
+            if not path or path in self._monitors:
+                continue
+            try:
+                monitor = Gio.File.new_for_path(path).monitor_file(Gio.FileMonitorFlags.WATCH_MOVES, None)
+            except Exception as e:
+                self.warn(f"Cannot watch '{path}': {e}")
+                continue
+            monitor.connect("changed", self._on_watched_file_changed, path)
+            self._monitors[path] = monitor
+            self.log(f"Watching {path}")
+
+    def _on_watched_file_changed(self, _monitor, _file, _other, event, path):
+        if event not in (Gio.FileMonitorEvent.CHANGES_DONE_HINT, Gio.FileMonitorEvent.CREATED,
+                         Gio.FileMonitorEvent.RENAMED, Gio.FileMonitorEvent.MOVED_IN):
+            return
+        # editors often write a file in several steps; settle before reloading
+        if path in self._reload_sources:
+            GLib.source_remove(self._reload_sources[path])
+        self._reload_sources[path] = GLib.timeout_add(150, self._reload_file, path)
+
+    def _reload_file(self, path):
+        self._reload_sources.pop(path, None)
+        try:
+            if path == self.css_path:
+                self.load_css(path)
+                self.log(f"Reloaded CSS {path}")
+            elif path == self.ui_path:
+                self.reload_markup()
+            elif path == self.logic_path:
+                self.reload_logic()
+        except Exception as e:
+            self.warn(f"Reload of '{path}' failed: {e}")
+        return False
+
+    def reload_logic(self):
+        logic = self.load_logic_module(self.logic_path, force=True)
+        if logic is None:
+            return
+        self.logic = logic
+        # handlers were bound to the old module, so rebuild every node that names one
+        def has_handler(elem):
+            return any(k.lower().startswith("on") for k in elem.attrib)
+        self._patch_all_windows(self.root, self.root, has_handler)
+        self.log(f"Reloaded logic {self.logic_path}")
+
+    def reload_markup(self):
+        root, app_info, _script = self.read_markup(self.ui_path)
+        if root.tag.lower() == "gtkm":
+            window_elem = next((child for child in root if child.tag.lower() == "window"), None)
+        else:
+            window_elem = root
+        if window_elem is None or window_elem.tag.lower() != "window":
+            self.warn("Reloaded markup has no <window> element; keeping the current UI")
+            return
+
+        self.app_info = app_info
+        self._patch_all_windows(self.root, window_elem)
+        live = set(root.iter())
+        for table in (self._props, self._typed_props):
+            for element in [element for element in table if element not in live]:
+                del table[element]
+        self._write_pending_plan()
+        self.template = self.root = window_elem
+        self.log(f"Reloaded markup {self.ui_path}")
+
+    def _patch_all_windows(self, old_window, new_window, force=None):
+        current = self.scope
+        for scope in list(self._scopes.values()):
+            self._activate_scope(scope)
+            self._patch_window(old_window, new_window, force)
+        self._activate_scope(current)
+
+    def _patch_window(self, old_window, new_window, force=None):
+        win = self.window
+        win.set_title(new_window.attrib.get("title") or self.app_info.get("program_name", "gtkML Application"))
+
+        old_hb = next((c for c in old_window if c.tag.lower() == "headerbar"), None)
+        new_hb = next((c for c in new_window if c.tag.lower() == "headerbar"), None)
+        if force is not None or _subtree_sig(old_hb) != _subtree_sig(new_hb):
+            win.set_titlebar(self.create_headerbar(new_hb) if new_hb is not None else None)
+
+        old_kids = [c for c in old_window if c.tag.lower() != "headerbar"]
+        new_kids = [c for c in new_window if c.tag.lower() != "headerbar"]
+        if [c.tag for c in old_kids] == [c.tag for c in new_kids]:
+            if all(self._patch_node(o, n, force) or self._replace_node(o, n) for o, n in zip(old_kids, new_kids)):
+                return
+
+        # structural change at the top level: rebuild the window contents
+        self._forget_subtree(old_window)
+        win.set_child(self.build_content(new_window))
+
+    def _patch_node(self, old, new, force=None):
+        # True if `old`'s widget now represents `new`; False asks the caller to rebuild it
+        if old not in self._element_widgets and old.tag.lower() not in ("tab", "column"):
+            # nothing was built for it (e.g. <script>, an unopened lazy tab)
+            return force is None and _subtree_sig(old) == _subtree_sig(new)
+        if _node_sig(old) != _node_sig(new) or (force is not None and force(old)):
+            return False
+        old_kids, new_kids = list(old), list(new)
+        if [c.tag for c in old_kids] != [c.tag for c in new_kids]:
+            return False
+        for o, n in zip(old_kids, new_kids):
+            if not (self._patch_node(o, n, force) or self._replace_node(o, n)):
+                return False
+        if old in self._element_widgets:
+            self._element_widgets[new] = self._element_widgets.pop(old)
+        return True
+
+    def _replace_node(self, old, new):
+        old_widget = self._element_widgets.get(old)
+        if old_widget is None:
+            return False
+        parent = old_widget.get_parent()
+        if isinstance(parent, Gtk.Box):
+            in_box = True
+        elif parent is not None and hasattr(parent, "get_child") and parent.get_child() is old_widget:
+            in_box = False
+        else:
+            return False
+
+        self._forget_subtree(old)
+        new_widget = self.create_widget(new)
+        if in_box:
+            if new_widget:
+                parent.insert_child_after(new_widget, old_widget)
+            parent.remove(old_widget)
+        else:
+            parent.set_child(new_widget)
+        return True
+
+    def _forget_subtree(self, element):
+        for elem in element.iter():
+            widget = self._element_widgets.pop(elem, None)
+            if widget is not None and self._bindings:
+                self.unbind_widget(widget)
+            if "id" in elem.attrib:
+                self.unregister_widget(elem.attrib["id"])
+
+    def release_subtree(self, element, widget):
+        # drop everything the app holds for widgets built from element's children
+        # into widget (ids, --watch entries, bindings, text feeds) before they are discarded
+        scope = self._scope_for_widget(widget)
+        current = self.scope
+        if scope is not None and scope is not current:
+            self._activate_scope(scope)
+        try:
+            for elem in element.iter():
+                if self._element_widgets is not None:
+                    self._element_widgets.pop(elem, None)
+                if "id" in elem.attrib:
+                    self.unregister_widget(elem.attrib["id"])
+        finally:
+            if scope is not None and scope is not current:
+                self._activate_scope(current)
+
+        released = set()
+        stack = [widget]
+        while stack:
+            w = stack.pop()
+            released.add(w)
+            feed = getattr(w, "_gtkml_feed", None)
+            if feed is not None:
+                feed.close()
+                w._gtkml_feed = None
+            child = w.get_first_child()
+            while child is not None:
+                stack.append(child)
+                child = child.get_next_sibling()
+        self.unbind_widgets(released)
 
     def get_app_root(self):
         return self._determine_app_root(preferred_app_dir=self.app_dir)
@@ -262,6 +2105,11 @@ class gtkMLApp:
 
         menu_model = Gio.Menu()
         menu_model.append("About", "app.about")
+        if self.diagnostics:
+            menu_model.append("Memory Snapshot", "app.memory-snapshot")
+            snapshot_action = Gio.SimpleAction.new("memory-snapshot", None)
+            snapshot_action.connect("activate", lambda *_: self.log("\n" + self.diagnostics.command("report")))
+            self.app.add_action(snapshot_action)
         menu_model.append("Quit", "app.quit")
 
         about_action = Gio.SimpleAction.new("about", None)
@@ -275,172 +2123,552 @@ class gtkMLApp:
         menu_button.set_menu_model(menu_model)
         return menu_button
 
-    def apply_common_properties(self, widget, attrib):
-        attrib = {k.lower(): v for k, v in attrib.items()}
+    def apply_common_properties(self, widget, attrib, props=None):
+        if props is None:
+            props = compile_properties(attrib)
 
-        def truthy(val):
-            return str(val).lower() in ("1", "true", "yes", "on")
+        # setter lookups are resolved once per (widget class, property set)
+        key = (type(widget), tuple(props))
+        ops = self._property_ops.get(key)
+        if ops is None:
+            ops = self._property_ops[key] = self._compile_property_ops(type(widget), props)
 
-        margin_keys = {
-            "margin": ("top", "bottom", "start", "end"),
-            "margin-top": ("top",),
-            "margin-bottom": ("bottom",),
-            "margin-start": ("start",),
-            "margin-end": ("end",),
-        }
-
-        for key, sides in margin_keys.items():
-            if key in attrib:
-                try:
-                    value = int(attrib[key])
-                    for side in sides:
-                        setter = getattr(widget, f"set_margin_{side}", None)
-                        if callable(setter):
-                            setter(value)
-                except Exception:
-                    continue
-
-        if "spacing" in attrib:
+        for name, op in ops:
             try:
-                spacing = int(attrib["spacing"])
-                if hasattr(widget, "set_spacing"):
-                    widget.set_spacing(spacing)
+                op(widget, props[name])
             except Exception:
                 pass
 
-        align_map = {
-            "fill": Gtk.Align.FILL,
-            "start": Gtk.Align.START,
-            "center": Gtk.Align.CENTER,
-            "end": Gtk.Align.END,
+    def _compile_property_ops(self, cls, props):
+        special = {
+            "classes": self._apply_classes,
+            "id": self._apply_id,
+            "field": self._apply_field,
+            "bind": self._apply_bindings,
         }
+        ops = []
+        for name in props:
+            op = special.get(name)
+            if op is None:
+                op = getattr(cls, f"set_{name}", None)
+                if not callable(op):
+                    continue
+            ops.append((name, op))
+        return ops
 
-        halign = attrib.get("halign", "").lower()
-        valign = attrib.get("valign", "").lower()
+    def _apply_classes(self, widget, classes):
+        for c in classes:
+            widget.add_css_class(c)
 
+    def _apply_id(self, widget, value):
+        # ids inside list row templates would be stamped once per row
+        if self._field_sink is not None:
+            return
+        self.widgets[value] = widget
+        self._widget_index[value.lower()] = widget
         try:
-            if halign in align_map:
-                widget.set_halign(align_map[halign])
-            if valign in align_map:
-                widget.set_valign(align_map[valign])
+            setattr(self, value, widget)
         except Exception:
             pass
 
-        if "expand" in attrib:
-            try:
-                val = truthy(attrib["expand"])
-                widget.set_hexpand(val)
-                widget.set_vexpand(val)
-            except Exception:
-                pass
+    def _apply_field(self, widget, value):
+        if self._field_sink is not None:
+            self._field_sink.append((value, widget))
+
+    def _apply_bindings(self, widget, bindings):
+        for attr, model, path in bindings:
+            self.bind_property(widget, attr, model, path)
+
+    def _element_props(self, element, tag, module):
+        props = self._props.get(element)
+        if props is None:
+            props = self._props[element] = compile_properties(element.attrib)
+        spec = self._attribute_specs.get(tag)
+        if spec is None:
+            spec = self._attribute_specs[tag] = compile_attribute_spec(getattr(module, "ATTRIBUTES", None))
+        if not spec:
+            return props
+        typed = self._typed_props.get(element)
+        if typed is None:
+            typed = self._typed_props[element] = compile_typed_properties(element.attrib, spec, props)
+        return typed
+
+    def get_handler(self, func_name, element=None, widget=None):
+        # logic handler by name; coroutine results are scheduled on the GLib-driven asyncio loop.
+        # With element, its debounce="ms" / throttle="ms" attributes rate-limit the handler;
+        # a call still pending when widget unrealizes is dropped.
+        if not func_name or not self.logic:
+            return None
+        handler = getattr(self.logic, func_name, None)
+        if not callable(handler):
+            self.warn(f"No such handler in logic.py: {func_name}")
+            return None
 
-        if "hexpand" in attrib:
-            try:
-                widget.set_hexpand(truthy(attrib["hexpand"]))
-            except Exception:
-                pass
+        def call(*args, **kwargs):
+            # make app.<id> refer to the window the signal came from
+            if args and isinstance(args[0], Gtk.Widget) and len(self._scopes) > 1:
+                scope = self._scope_for_widget(args[0])
+                if scope is not None and scope is not self.scope:
+                    self._activate_scope(scope)
+            result = handler(*args, **kwargs)
+            if result is not None and hasattr(result, "__await__"):
+                self.create_task(result)
+                return None
+            return result
 
-        if "vexpand" in attrib:
+        if element is not None:
+            debounce = element.attrib.get("debounce")
+            throttle = element.attrib.get("throttle")
+            limited = None
             try:
-                widget.set_vexpand(truthy(attrib["vexpand"]))
-            except Exception:
-                pass
-
-        if "disabled" in attrib and truthy(attrib["disabled"]):
+                if debounce:
+                    limited = RateLimitedHandler(call, debounce=int(debounce))
+                elif throttle:
+                    limited = RateLimitedHandler(call, throttle=int(throttle))
+            except ValueError:
+                self.warn(f"Invalid debounce/throttle on <{element.tag}>: {debounce or throttle}")
+            if limited is not None:
+                if widget is not None:
+                    widget.connect("unrealize", lambda _w: limited.cancel())
+                return limited
+        return call
+
+    def _wants_asyncio(self):
+        # async def handlers, found from their code flags so asyncio stays unimported otherwise
+        logic = self.logic
+        if "asyncio" in sys.modules:
+            return True
+        if logic is None or isinstance(logic, DeferredLogic):
+            return False
+        return any(getattr(getattr(value, "__code__", None), "co_flags", 0) & CO_COROUTINE
+                   for value in vars(logic).values())
+
+    def _asyncio_loop(self):
+        if self._aio_loop is None:
+            import asyncio
             try:
-                widget.set_sensitive(False)
-            except Exception:
-                pass
-        elif "enabled" in attrib:
+                from gi.events import GLibEventLoopPolicy
+                policy = GLibEventLoopPolicy()
+                asyncio.set_event_loop_policy(policy)
+                self._aio_loop = policy.get_event_loop()
+            except ImportError:
+                # older PyGObject: step a private loop from a GLib timeout while tasks exist
+                self._aio_loop = asyncio.new_event_loop()
+        return self._aio_loop
+
+    def _pump_asyncio(self):
+        import asyncio
+        loop = self._aio_loop
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+        if asyncio.all_tasks(loop):
+            return True
+        self._aio_pump = 0
+        return False
+
+    def create_task(self, coro):
+        loop = self._asyncio_loop()
+        task = loop.create_task(coro)
+        scope = self.scope
+        self._tasks.add(task)
+        scope.tasks.add(task)
+
+        def on_done(t):
+            self._tasks.discard(t)
+            scope.tasks.discard(t)
+            if not t.cancelled() and t.exception() is not None:
+                self.warn(f"Async handler failed: {t.exception()!r}")
+
+        task.add_done_callback(on_done)
+        if not loop.is_running() and not self._aio_pump:
+            self._aio_pump = GLib.timeout_add(10, self._pump_asyncio)
+        return task
+
+    def run_in_background(self, fn, *args, on_done=None, on_error=None, process=False, scoped=True):
+        # run fn(*args) on a bounded pool; on_done(result) / on_error(exc) run on the main loop.
+        # Scoped jobs belong to the current window: closing it cancels them and drops their callbacks.
+        if process:
+            if self._process_pool is None:
+                from concurrent.futures import ProcessPoolExecutor
+                self._process_pool = ProcessPoolExecutor(max_workers=BACKGROUND_WORKERS)
+            pool = self._process_pool
+        else:
+            if self._thread_pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._thread_pool = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="gtkml-bg")
+            pool = self._thread_pool
+
+        stats = self.background_stats
+        future = pool.submit(fn, *args)
+        scope = self.scope if scoped else None
+        self._futures.add(future)
+        if scope is not None:
+            scope.futures.add(future)
+        stats["submitted"] += 1
+        stats["queue_depth"] += 1
+        stats["max_queue_depth"] = max(stats["max_queue_depth"], stats["queue_depth"])
+
+        def deliver(f):
+            stats["queue_depth"] -= 1
+            self._futures.discard(f)
+            if scope is not None:
+                scope.futures.discard(f)
+            # a job already running when its window closed finishes, but its widgets are gone
+            if f.cancelled() or (scope is not None and scope.closed):
+                stats["cancelled"] += 1
+                return False
+            err = f.exception()
+            if err is None:
+                stats["completed"] += 1
+                if on_done:
+                    on_done(f.result())
+            else:
+                stats["failed"] += 1
+                if on_error:
+                    on_error(err)
+                else:
+                    self.warn(f"Background task {getattr(fn, '__name__', fn)} failed: {err!r}")
+            return False
+
+        future.add_done_callback(lambda f: GLib.idle_add(deliver, f))
+        return future
+
+    def cancel_background(self):
+        for future in list(self._futures):
+            future.cancel()
+        for task in list(self._tasks):
+            task.cancel()
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._thread_pool = self._process_pool = None
+
+    def model(self, name):
+        model = self.models.get(name)
+        if model is None:
+            model = self.models[name] = Model(self, name)
+        return model
+
+    def bind_property(self, widget, attr, model_name, path):
+        key = path.partition(".")[0]
+        bindings = self._bindings.setdefault((model_name, key), [])
+
+        # weak: a binding must not keep a widget from a closed window or a released
+        # page alive; the entry goes away with the widget
+        def on_collected(ref):
+            bindings[:] = [b for b in bindings if b[0] is not ref]
+
+        # instance data keeps PyGObject's wrapper (and so the weakref) alive
+        # for as long as the widget itself
+        widget._gtkml_bound = True
+        bindings.append((weakref.ref(widget, on_collected), attr, path))
+        model = self.models.get(model_name)
+        if model is not None and key in model._values:
             try:
-                widget.set_sensitive(truthy(attrib["enabled"]))
-            except Exception:
-                pass
+                apply_bound_value(widget, attr, model.get(path))
+            except Exception as e:
+                self.warn(f"Could not bind {attr}=\"{{{model_name}.{path}}}\": {e}")
+
+    def unbind_widget(self, widget):
+        self.unbind_widgets({widget})
+
+    def unbind_widgets(self, widgets):
+        for bindings in self._bindings.values():
+            bindings[:] = [b for b in bindings if b[0]() not in widgets]
+
+    def mark_dirty(self, model_name, key):
+        # may be called from any thread; changes are applied once per frame, from
+        # the window's frame clock just before layout and paint
+        with self._dirty_lock:
+            self._dirty.add((model_name, key))
+            if self._flush_queued:
+                return
+            self._flush_queued = True
+        if threading.current_thread() is threading.main_thread():
+            self._schedule_flush()
+        else:
+            GLib.idle_add(self._schedule_flush)
+
+    def _schedule_flush(self):
+        win = self.window
+        if win is None or not win.get_mapped():
+            # no frames are being drawn, so there is nothing to wait for
+            GLib.idle_add(self.flush_bindings, priority=GLib.PRIORITY_HIGH_IDLE)
+            return False
+
+        def on_tick(_widget, _clock):
+            win.disconnect(unmap_id)
+            return self.flush_bindings()
+
+        def on_unmap(_widget):
+            # tick callbacks stop with the window; flush what is queued anyway
+            win.disconnect(unmap_id)
+            win.remove_tick_callback(tick_id)
+            self.flush_bindings()
+
+        tick_id = win.add_tick_callback(on_tick)
+        unmap_id = win.connect("unmap", on_unmap)
+        return False
+
+    def flush_bindings(self):
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+            self._flush_queued = False
+        for model_name, key in dirty:
+            model = self.models.get(model_name)
+            for ref, attr, path in list(self._bindings.get((model_name, key), ())):
+                widget = ref()
+                if widget is None:
+                    continue
+                try:
+                    apply_bound_value(widget, attr, model.get(path))
+                except Exception as e:
+                    self.warn(f"Could not update {attr}=\"{{{model_name}.{path}}}\": {e}")
+        return False
+
+    def get_list_model(self, name):
+        store = self.list_models.get(name)
+        if store is None:
+            store = Gio.ListStore(item_type=ListRow)
+            self.list_models[name] = store
+        return store
+
+    def set_rows(self, name, rows):
+        store = self.get_list_model(name)
+        store.splice(0, store.get_n_items(), [ListRow(r) for r in rows])
+
+    def append_rows(self, name, rows, batch_size=None):
+        # one splice (and one items-changed) per batch; with batch_size the
+        # batches are spread over idle callbacks so huge pushes stay responsive
+        store = self.get_list_model(name)
+        rows = list(rows)
+        if not batch_size or len(rows) <= batch_size:
+            store.splice(store.get_n_items(), 0, [ListRow(r) for r in rows])
+            return
 
+        def push(offset):
+            chunk = rows[offset:offset + batch_size]
+            store.splice(store.get_n_items(), 0, [ListRow(r) for r in chunk])
+            if offset + batch_size < len(rows):
+                GLib.idle_add(push, offset + batch_size)
+            return False
+
+        push(0)
+
+    def text_feed(self, target, max_lines=None, follow=None):
+        # target is a textview id or widget; the feed is created on first use
+        view = self.widgets.get(target) if isinstance(target, str) else target
+        if view is None:
+            self.warn(f"No textview with id '{target}'")
+            return None
+        feed = getattr(view, "_gtkml_feed", None)
+        if feed is None:
+            feed = view._gtkml_feed = TextFeed(view, max_lines, bool(follow))
+        else:
+            if max_lines is not None:
+                feed.max_lines = max_lines
+            if follow is not None:
+                feed.follow = bool(follow)
+        return feed
+
+    def load_text(self, target, path, follow=None, max_lines=None):
+        bundled = self.bundle.lookup(path) if self.bundle else None
+        if bundled:
+            path = bundled
+        elif not os.path.isabs(path) and os.path.exists(os.path.join(self.app_root, path)):
+            path = os.path.join(self.app_root, path)
+        feed = self.text_feed(target, max_lines, follow)
+        if feed is not None:
+            feed.load(path)
+        return feed
+
+    def append_lines(self, target, lines, batch_size=1000):
+        # one buffer insert per batch instead of one per line
+        feed = self.text_feed(target)
+        if feed is None:
+            return
+        lines = list(lines)
+        for i in range(0, len(lines), batch_size):
+            feed.append("\n".join(lines[i:i + batch_size]) + "\n")
+
+    def canvas_plot(self, target):
+        # the CanvasPlot that widgets/canvas.py attached to a <canvas>
+        area = self.widgets.get(target) if isinstance(target, str) else target
+        plot = getattr(area, "_gtkml_plot", None)
+        if plot is None:
+            self.warn(f"No canvas with id '{target}'")
+        return plot
+
+    def push_samples(self, target, values):
+        # safe at any rate: the canvas redraws at most once per frame
+        plot = self.canvas_plot(target)
+        if plot is not None:
+            plot.push(values)
+
+    def build_template(self, elements):
+        sink = []
+        previous, self._field_sink = self._field_sink, sink
         try:
-            ctx = widget.get_style_context()
-        except Exception:
-            ctx = None
-
-        if ctx:
-            classes = []
-            if "class" in attrib:
-                classes += attrib["class"].split()
-            if "classes" in attrib:
-                classes += attrib["classes"].split()
-            for c in classes:
-                try:
-                    ctx.add_class(c)
-                except Exception:
-                    pass
+            widgets = [w for w in (self.create_widget(e) for e in elements) if w]
+        finally:
+            self._field_sink = previous
 
-        if "id" in attrib:
-            wid = attrib["id"]
-            self.widgets[wid] = widget
-            try:
-                setattr(self, wid, widget)
-            except Exception:
-                pass
+        if len(widgets) == 1:
+            root = widgets[0]
+        else:
+            root = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+            for widget in widgets:
+                root.append(widget)
+        root._gtkml_fields = sink
+        return root
 
-    def _load_widget_module_from_file(self, tag):
+    def create_list_factory(self, elements):
+        factory = Gtk.SignalListItemFactory()
+
+        def setup(_factory, item):
+            item.set_child(self.build_template(elements))
+
+        def bind(_factory, item):
+            child = item.get_child()
+            data = item.get_item().data
+            for field, widget in getattr(child, "_gtkml_fields", ()):
+                set_widget_value(widget, row_value(data, field))
+
+        factory.connect("setup", setup)
+        factory.connect("bind", bind)
+        return factory
+
+    def create_selection_model(self, element):
+        store = self.get_list_model(element.attrib.get("model") or element.attrib.get("id") or "default")
+        mode = element.attrib.get("selection", "none").lower()
+        if mode == "single":
+            return store, Gtk.SingleSelection(model=store)
+        if mode == "multiple":
+            return store, Gtk.MultiSelection(model=store)
+        return store, Gtk.NoSelection(model=store)
+
+    def connect_row_activate(self, widget, element, store):
+        handler = self.get_handler(element.attrib.get("onactivate"))
+        if handler:
+            widget.connect("activate", lambda w, position: handler(w, store.get_item(position).data))
+
+    def unregister_widget(self, wid):
+        widget = self.widgets.pop(wid, None)
+        if widget is not None and self.__dict__.get(wid) is widget:
+            del self.__dict__[wid]
+        if self._widget_index.get(wid.lower()) is widget:
+            # another id may differ only in case; fall back to it if so
+            del self._widget_index[wid.lower()]
+            for key, other in self.widgets.items():
+                if key.lower() == wid.lower():
+                    self._widget_index[key.lower()] = other
+                    break
+        return widget
+
+    def widget_search_dirs(self):
         # Try several candidate directories for widget files. This is necessary
         # because when using Nuitka in onefile mode data directories may be
         # placed next to the executable or in other runtime locations.
-        tried = []
         candidates = []
         if self.widgets_dir:
             candidates.append(self.widgets_dir)
         # app_dir (where ui.gtkm / logic.py live)
-        try:
-            candidates.append(os.path.join(self.app_dir, "widgets"))
-        except Exception:
-            pass
+        candidates.append(os.path.join(self.app_dir, "widgets"))
         # app_root (runtime base)
-        try:
-            candidates.append(os.path.join(self.app_root, "widgets"))
-        except Exception:
-            pass
+        candidates.append(os.path.join(self.app_root, "widgets"))
         # dirname of the executable (useful for frozen / onefile builds)
-        try:
-            candidates.append(os.path.join(os.path.dirname(sys.executable), "widgets"))
-        except Exception:
-            pass
+        candidates.append(os.path.join(os.path.dirname(sys.executable), "widgets"))
         # local repository layout
         candidates.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "widgets"))
         candidates.append(os.path.join(os.getcwd(), "widgets"))
 
-        # remove duplicates while preserving order
-        seen = set()
+        # remove duplicates while preserving order; the built-in package is
+        # imported, not scanned, so only real overrides go through the file loader
+        seen = {BUILTIN_WIDGETS_DIR}
         filtered = []
         for p in candidates:
-            if not p:
-                continue
-            if p in seen:
+            if not p or p in seen or os.path.realpath(p) in seen:
                 continue
             seen.add(p)
             filtered.append(p)
+        return filtered
+
+    def scan_widget_dirs(self):
+        start = time.perf_counter()
+        self._widget_files = scan_widget_dirs(self.widget_search_dirs())
+        if self.bundle:
+            # widgets shipped in the bundle win over loose override files
+            for name in self.bundle.names:
+                folder, _, file_name = name.rpartition("/")
+                if folder == "widgets" and file_name.endswith(".py") and not file_name.startswith("_"):
+                    self._widget_files[file_name[:-3].lower()] = self.bundle.lookup(name)
+        self._missing_widgets.clear()
+        if self.profiler:
+            self.profiler.registry_scan = time.perf_counter() - start
+
+    def register_widget(self, tag, create=None, attributes=None):
+        # usable directly or as a decorator: @app.register_widget("mytag", attributes={"wrap": "bool"})
+        def decorator(fn):
+            tag_name = tag.lower()
+            self._registered_widgets[tag_name] = SimpleNamespace(
+                create=fn, ATTRIBUTES=attributes, __name__=f"gtkml_widget_{tag_name}")
+            self._widget_module_cache.pop(tag_name, None)
+            self._attribute_specs.pop(tag_name, None)
+            self._missing_widgets.discard(tag_name)
+            return fn
+        return decorator(create) if create is not None else decorator
 
-        for d in filtered:
-            module_path = os.path.join(d, f"{tag}.py")
-            tried.append(module_path)
-            if os.path.exists(module_path):
-                try:
-                    name = f"gtkml_widget_{tag}"
-                    spec = importlib.util.spec_from_file_location(name, module_path)
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    return module
-                except Exception as e:
-                    self.warn(f"Failed to load widget module file {module_path}: {e}")
-                    return None
+    def _load_widget_module_from_file(self, tag):
+        module_path = self._widget_files.get(tag)
+        if module_path is None:
+            return None
+        try:
+            name = f"gtkml_widget_{tag}"
+            if is_resource(module_path):
+                module = ModuleType(name)
+                module.__file__ = module_path
+                exec(self.bundle.code(module_path, module_path), module.__dict__)
+                return module
+            spec = importlib.util.spec_from_file_location(name, module_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module
+        except Exception as e:
+            self.warn(f"Failed to load widget module file {module_path}: {e}")
+            return None
 
-        # nothing found
-        return None
+    def _load_widget_module_via_entry_point(self, tag):
+        if self._entry_points is None:
+            self._entry_points = {}
+            try:
+                from importlib.metadata import entry_points
+                for ep in entry_points(group="gtkml.widgets"):
+                    self._entry_points.setdefault(ep.name.lower(), ep)
+            except Exception as e:
+                self.warn(f"Could not read gtkml.widgets entry points: {e}")
+        ep = self._entry_points.get(tag)
+        if ep is None:
+            return None
+        try:
+            module = ep.load()
+        except Exception as e:
+            self.warn(f"Error loading widget entry point '{ep.value}': {e}")
+            return None
+        # an entry point may name a module or the create() function itself
+        return module if hasattr(module, "create") else SimpleNamespace(create=module)
+
+    def _load_builtin_widget_module(self, tag):
+        if tag not in BUILTIN_WIDGETS:
+            return None
+        try:
+            return importlib.import_module(f"widgets.{tag}")
+        except Exception as e:
+            self.warn(f"Error importing built-in widget '{tag}': {e}")
+            return None
 
     def _load_widget_module_via_import(self, tag):
         candidates = [
             f"gtkML.widgets.{tag}",
-            f"widgets.{tag}",
             f"gtkml.widgets.{tag}",
             tag,
         ]
@@ -454,33 +2682,76 @@ class gtkMLApp:
                 self.warn(f"Error importing widget module '{name}': {e}")
         return None
 
-    def create_widget(self, element):
-        tag = element.tag.lower()
+    def _preload_widget_modules(self, tags):
+        # only the cheap loaders; import and entry-point fallbacks wait until the tag is built
+        for tag in tags:
+            if tag in self._widget_module_cache:
+                continue
+            module = (self._registered_widgets.get(tag) or self._load_widget_module_from_file(tag)
+                      or self._load_builtin_widget_module(tag))
+            if module is not None:
+                self._widget_module_cache[tag] = module
 
+    def _get_widget_module(self, tag):
         module = self._widget_module_cache.get(tag)
-        if not module:
-            module = self._load_widget_module_from_file(tag)
+        if module:
+            return module
+
+        if tag not in self._missing_widgets:
+            start = time.perf_counter()
+            module = self._registered_widgets.get(tag)
+            if module is None:
+                module = self._load_widget_module_from_file(tag)
+            if module is None:
+                module = self._load_builtin_widget_module(tag)
             if module is None:
                 module = self._load_widget_module_via_import(tag)
-
             if module is None:
-                self.warn(f"No widget handler for <{tag}>")
-                return None
+                module = self._load_widget_module_via_entry_point(tag)
+            if self.profiler:
+                self.profiler.resolved(tag, time.perf_counter() - start, module is not None)
 
-            self._widget_module_cache[tag] = module
+            if module is not None:
+                self._widget_module_cache[tag] = module
+                return module
+            self._missing_widgets.add(tag)
+
+        self.warn(f"No widget handler for <{tag}>")
+        return None
+
+    def create_widget(self, element):
+        tag = element.tag.lower()
+
+        module = self._get_widget_module(tag)
+        if module is None:
+            return None
 
         if not hasattr(module, "create"):
             self.warn(f"Widget module '{tag}' missing create() function")
             return None
 
+        scheduler = self._scheduler
+        if scheduler is not None and self._field_sink is None and scheduler.should_defer(element):
+            return scheduler.defer(element)
+
+        profiler = self.profiler
+        if profiler:
+            profiler.enter(tag, element)
         try:
             widget = module.create(self, element)
             if widget:
-                self.apply_common_properties(widget, element.attrib)
+                self.apply_common_properties(widget, element.attrib, self._element_props(element, tag, module))
+                if self._element_widgets is not None:
+                    self._element_widgets[element] = widget
+                if self.diagnostics:
+                    self.diagnostics.track(tag, widget)
             return widget
         except Exception as e:
             self.warn(f"Error creating widget <{tag}>: {e}")
             return None
+        finally:
+            if profiler:
+                profiler.leave()
 
     def show_about(self, *_args):
         info = self.app_info
@@ -497,25 +2768,102 @@ class gtkMLApp:
         if info.get("icon"):
             icon_path = info.get("icon")
             icon_file = icon_path if os.path.isabs(icon_path) else os.path.join(self.app_dir, icon_path)
+            if self.bundle:
+                icon_file = self.bundle.lookup(icon_file) or icon_file
             try:
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(icon_file, 128, 128)
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                dialog.set_logo(texture)
+                dialog.set_logo(self.textures.load(icon_file, 128, 128))
             except Exception as e:
                 self.warn(f"Could not load icon '{icon_path}': {e}")
 
         dialog.present()
 
     def on_activate(self, app):
-        win = self.build_ui()
+        if self._scopes:
+            # a repeated activation presents the existing window instead of rebuilding
+            (app.get_active_window() or self.window).present()
+            return
+        with STARTUP.phase("build_ui"):
+            win = self.build_ui()
         app.add_window(win)
+        present_start = time.monotonic()
         win.present()
+        STARTUP.add("present", present_start, time.monotonic())
+        if not STARTUP.finished:
+            self.after_first_frame(win, lambda: self._on_first_frame(present_start))
+        if self._pending_plan is not None:
+            self.after_first_frame(win, self._write_pending_plan)
+        if self._deferred_logic_path:
+            self.after_first_frame(win, self.load_deferred_logic)
+        if self.watching:
+            self.watch_files([self.ui_path, self.css_path, self.logic_path])
+
+    def on_command_line(self, app, cmdline):
+        # our own launch activates normally; a forwarded launch stamps a new
+        # window from the parsed template, CSS and textures already in memory
+        if not self._scopes:
+            app.activate()
+            return 0
+        win = self.open_window()
+        if cmdline.get_is_remote():
+            # the launching process waits until cmdline is released, i.e. the window has painted
+            self.after_first_frame(win, lambda: cmdline.set_exit_status(0))
+        return 0
+
+    def on_open(self, app, files, _n_files, _hint):
+        # Open requests over D-Bus (file managers, gapplication launch)
+        if files:
+            self.log(f"Open requested for {', '.join(f.get_parse_name() for f in files)}")
+        if not self._scopes:
+            app.activate()
+        else:
+            self.open_window()
+
+    def _on_first_frame(self, present_start):
+        STARTUP.add("first_frame", present_start, time.monotonic())
+        STARTUP.finished = True
+        if self.startup_report:
+            report = json.dumps(STARTUP.report())
+            if isinstance(self.startup_report, str):
+                try:
+                    with open(self.startup_report, "w", encoding="utf-8") as f:
+                        f.write(report + "\n")
+                except OSError as e:
+                    self.warn(f"Could not write startup report '{self.startup_report}': {e}")
+            else:
+                print(report)
+        if self.exit_after_first_frame:
+            self.app.quit()
+        return False
 
     def run(self, css_path=None):
         css_path = css_path or self.app_info.get("css")
         if css_path:
-            self.load_css(css_path)
-        self.app.run(None)
+            with STARTUP.phase("load_css"):
+                self.load_css(css_path)
+        if self._wants_asyncio():
+            # GLibEventLoopPolicy has to be in place before the main loop starts
+            self._asyncio_loop()
+        # only positional arguments: our --flags are not registered GApplication options
+        self.app.run([sys.argv[0]] + cli_args())
+        self.textures.shutdown()
+
+
+def application_id_for(app_dir):
+    # one primary instance per app directory, so two different apps never share a process
+    digest = hashlib.sha1(os.path.realpath(app_dir).encode("utf-8")).hexdigest()[:12]
+    return f"{DEFAULT_APP_ID}.a{digest}"
+
+
+def claim_instance(app_id, new_instance=False):
+    # register before anything is parsed: if another process already owns app_id
+    # the returned application is remote and run() only forwards the command line
+    flags = (APP_FLAGS | Gio.ApplicationFlags.NON_UNIQUE) if new_instance else APP_FLAGS
+    application = Gtk.Application(application_id=app_id, flags=flags)
+    try:
+        application.register(None)
+    except GLib.Error as e:
+        warn(f"Could not register {app_id}: {e.message}")
+    return application
 
 
 def get_runtime_dir():
@@ -577,9 +2925,100 @@ def find_app_paths(start_path):
 
     return app_dir, ui_path, logic_path, css_path
 
+def bundle_app(app_dir, ui_path):
+    # everything in the app dir (markup, CSS, images, logic and widget sources)
+    # plus the compiled UI plan and bytecode, as <app_dir>/app.gresource
+    import shutil
+    import subprocess
+    import tempfile
+
+    if not ui_path:
+        error(f"No ui.gtkm found in {app_dir}")
+        return False
+    tool = shutil.which("glib-compile-resources")
+    if tool is None:
+        error("glib-compile-resources not found (it comes with GLib's development tools)")
+        return False
+
+    out_path = os.path.join(app_dir, BUNDLE_NAME)
+    with tempfile.TemporaryDirectory(prefix="gtkml-bundle-") as gen_dir:
+        def generated(rel, data):
+            path = os.path.join(gen_dir, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+            files.append(rel)
+
+        files = []
+        try:
+            for dirpath, dirnames, filenames in os.walk(app_dir):
+                dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d != "__pycache__")
+                for name in sorted(filenames):
+                    if name.startswith(".") or name.endswith((".gresource", ".pyc", ".gtkmc")):
+                        continue
+                    src = os.path.join(dirpath, name)
+                    rel = os.path.relpath(src, app_dir).replace(os.sep, "/")
+                    files.append(rel)
+                    if name.endswith(".py"):
+                        with open(src, "rb") as f:
+                            code = compile(f.read(), src, "exec")
+                        generated(rel + "c", importlib.util.MAGIC_NUMBER + marshal.dumps(code))
+
+            plan = compile_markup(ui_path, [os.path.join(app_dir, "widgets")])
+            ui_rel = os.path.relpath(ui_path, app_dir).replace(os.sep, "/")
+            generated(ui_rel + "c", pickle.dumps(plan, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            error(f"Could not bundle '{app_dir}': {e}")
+            return False
+
+        manifest = ET.Element("gresources")
+        resource = ET.SubElement(manifest, "gresource", prefix=RESOURCE_PREFIX)
+        for rel in files:
+            # uncompressed, so the files are used straight from the mmapped bundle
+            ET.SubElement(resource, "file").text = rel
+        manifest_path = os.path.join(gen_dir, "app.gresource.xml")
+        ET.ElementTree(manifest).write(manifest_path, encoding="utf-8", xml_declaration=True)
+
+        result = subprocess.run([tool, f"--sourcedir={gen_dir}", f"--sourcedir={app_dir}",
+                                 f"--target={out_path}", manifest_path], capture_output=True, text=True)
+        if result.returncode != 0:
+            error(f"glib-compile-resources failed: {result.stderr.strip()}")
+            return False
+
+    log(f"Bundled {len(files)} files from {app_dir} -> {out_path}")
+    return True
+
+
+def _node_sig(elem):
+    return (elem.tag, tuple(sorted(elem.attrib.items())), (elem.text or "").strip())
+
+
+def _subtree_sig(elem):
+    if elem is None:
+        return None
+    return tuple(_node_sig(e) + (len(e),) for e in elem.iter())
+
+
+def compile_app(app_dir, ui_path):
+    if not ui_path:
+        error(f"No ui.gtkm found in {app_dir}")
+        return False
+    widget_dirs = [os.path.join(app_dir, "widgets")]
+    try:
+        plan = compile_markup(ui_path, widget_dirs)
+        out_path = plan_cache_paths(ui_path)[0]
+        save_plan(plan, out_path)
+        log(f"Compiled {ui_path} -> {out_path} ({len(plan['index'])} elements)")
+    except Exception as e:
+        error(f"Could not compile '{ui_path}': {e}")
+        return False
+    return True
+
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        start_path = sys.argv[1]
+    flags = cli_flags()
+    args = cli_args()
+    if args:
+        start_path = args[0]
     else:
         if getattr(sys, "frozen", False):
             base = os.path.dirname(sys.executable)
@@ -587,8 +3026,37 @@ if __name__ == "__main__":
             base = os.path.dirname(os.path.abspath(__file__))
         start_path = os.path.join(base, "example")
 
-    app_dir, ui_path, logic_path, css_path = find_app_paths(start_path)
-
-    app = gtkMLApp(ui_path, logic_path)
+    with STARTUP.phase("find_app_paths"):
+        app_dir, ui_path, logic_path, css_path = find_app_paths(start_path)
+
+    if "--compile" in flags:
+        sys.exit(0 if compile_app(app_dir, ui_path) else 1)
+    if "--bundle" in flags:
+        sys.exit(0 if bundle_app(app_dir, ui_path) else 1)
+
+    with STARTUP.phase("claim_instance"):
+        application = claim_instance(application_id_for(app_dir), "--new-instance" in flags)
+    if application.get_is_remote():
+        sys.exit(application.run([sys.argv[0]] + args))
+
+    bundle = None
+    if "--watch" not in flags and "--no-bundle" not in flags:
+        with STARTUP.phase("load_bundle"):
+            bundle = find_bundle(app_dir)
+    if bundle is not None:
+        # a bundle can be shipped without the loose files it was built from
+        ui_path = ui_path or os.path.join(app_dir, "ui.gtkm")
+        if not logic_path and bundle.lookup("logic.py"):
+            logic_path = os.path.join(app_dir, "logic.py")
+        if not css_path and bundle.lookup("style.css"):
+            css_path = os.path.join(app_dir, "style.css")
+
+    app = gtkMLApp(ui_path, logic_path, profile=True if "--profile" in flags else None,
+                   watch="--watch" in flags, defer_logic="--defer-logic" in flags,
+                   startup_report=flags.get("--profile-startup") or os.environ.get("GTKML_STARTUP_REPORT"),
+                   diagnostics=True if "--diagnostics" in flags else None,
+                   stream=True if "--stream" in flags else None,
+                   exit_after_first_frame="--exit-after-first-frame" in flags,
+                   application=application, bundle=bundle)
     app.app_root = app_dir
     app.run(css_path)
@@ -0,0 +1,7 @@
+# Built-in widget set. main.py imports these as a package (compiled into the
+# Nuitka binary); widgets/ directories next to an app only hold overrides.
+BUILTIN = (
+    "button", "canvas", "centerbox", "checkbox", "columnview", "entry",
+    "flowbox", "frame", "grid", "gridview", "hbox", "img", "label",
+    "listview", "notebook", "script", "scroll", "switch", "textview", "vbox",
+)
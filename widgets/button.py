@@ -13,12 +13,8 @@ def create(app, element):
         widget = Gtk.Button(label=label)
 
     # connect onclick handler if present
-    if "onclick" in element.attrib and app.logic:
-        func_name = element.attrib["onclick"]
-        handler = getattr(app.logic, func_name, None)
-        if callable(handler):
-            widget.connect("clicked", handler)
-        else:
-            app.warn(f"No such handler in logic.py: {func_name}")
+    handler = app.get_handler(element.attrib.get("onclick"), element, widget)
+    if handler:
+        widget.connect("clicked", handler)
 
     return widget
@@ -0,0 +1,200 @@
+from gi.repository import Gtk
+from array import array
+
+ATTRIBUTES = {
+    "width": ("int", "content_width"),
+    "height": ("int", "content_height"),
+}
+
+_NUMPY = None
+
+def optional_numpy():
+    # imported on first use so apps without a <canvas> do not pay for it at startup
+    global _NUMPY
+    if _NUMPY is None:
+        try:
+            import numpy
+            _NUMPY = numpy
+        except ImportError:
+            _NUMPY = False
+    return _NUMPY or None
+
+class SampleRing:
+    # fixed-capacity float ring; NumPy-backed when available, array("d") otherwise
+    def __init__(self, capacity):
+        self.capacity = max(1, int(capacity))
+        self.np = optional_numpy()
+        if self.np is not None:
+            self.data = self.np.zeros(self.capacity, dtype=self.np.float64)
+        else:
+            self.data = array("d", bytes(8 * self.capacity))
+        self.head = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def extend(self, values):
+        if self.np is not None:
+            values = self.np.asarray(values, dtype=self.np.float64).ravel()
+        elif not isinstance(values, array):
+            values = array("d", values)
+        n = len(values)
+        cap = self.capacity
+        if n >= cap:
+            self.data[:] = values[n - cap:]
+            self.head, self.count = 0, cap
+            return
+        end = self.head + n
+        if end <= cap:
+            self.data[self.head:end] = values
+        else:
+            split = cap - self.head
+            self.data[self.head:] = values[:split]
+            self.data[:end - cap] = values[split:]
+        self.head = end % cap
+        self.count = min(cap, self.count + n)
+
+    def append(self, value):
+        self.extend((value,))
+
+    def clear(self):
+        self.head = self.count = 0
+
+    def values(self):
+        # oldest first
+        if self.count < self.capacity:
+            return self.data[:self.count]
+        if self.np is not None:
+            return self.np.concatenate((self.data[self.head:], self.data[:self.head]))
+        return self.data[self.head:] + self.data[:self.head]
+
+def minmax_columns(values, columns, np=None):
+    # decimate to one (min, max) pair per pixel column
+    n = len(values)
+    if n <= columns:
+        return values, values
+    if np is not None:
+        starts = (np.arange(columns) * n) // columns
+        return np.minimum.reduceat(values, starts), np.maximum.reduceat(values, starts)
+    bounds = [i * n // columns for i in range(columns + 1)]
+    mins = [min(values[a:b]) for a, b in zip(bounds, bounds[1:])]
+    maxs = [max(values[a:b]) for a, b in zip(bounds, bounds[1:])]
+    return mins, maxs
+
+class CanvasPlot:
+    # samples + renderer for a <canvas>; pushes only request a redraw, and the
+    # frame clock coalesces them to at most one draw per frame
+    def __init__(self, app, area, capacity=10000, renderer="line", on_draw=None, y_range=(None, None)):
+        self.app = app
+        self.area = area
+        self.samples = SampleRing(capacity)
+        self.renderer = renderer
+        self.on_draw = on_draw
+        self.y_min, self.y_max = y_range
+        self._tick = 0
+        area.set_draw_func(self._draw)
+
+    def push(self, values):
+        self.samples.extend(values)
+        self.queue_redraw()
+
+    def queue_redraw(self):
+        if not self._tick:
+            self._tick = self.area.add_tick_callback(self._on_tick)
+
+    def _on_tick(self, area, _clock):
+        self._tick = 0
+        area.queue_draw()
+        return False
+
+    def _draw(self, area, cr, width, height):
+        try:
+            if self.on_draw:
+                self.on_draw(area, cr, width, height, self)
+            elif self.renderer == "area":
+                self.render_area(cr, width, height)
+            elif self.renderer != "none":
+                self.render_line(cr, width, height)
+        except Exception as e:
+            self.app.warn(f"Canvas draw failed: {e}")
+
+    def _columns(self, width, height):
+        values = self.samples.values()
+        if len(values) < 2 or width < 2:
+            return None
+        np = self.samples.np
+        mins, maxs = minmax_columns(values, width, np)
+        lo = self.y_min if self.y_min is not None else float(min(mins))
+        hi = self.y_max if self.y_max is not None else float(max(maxs))
+        scale = (height - 1) / ((hi - lo) or 1.0)
+        step = (width - 1) / (len(mins) - 1)
+        if np is not None:
+            top = (height - 1 - (maxs - lo) * scale).tolist()
+            bottom = (height - 1 - (mins - lo) * scale).tolist()
+        else:
+            top = [height - 1 - (v - lo) * scale for v in maxs]
+            bottom = [height - 1 - (v - lo) * scale for v in mins]
+        return step, top, bottom
+
+    def _set_color(self, cr, alpha=1.0):
+        try:
+            color = self.area.get_color()
+            cr.set_source_rgba(color.red, color.green, color.blue, color.alpha * alpha)
+        except Exception:
+            cr.set_source_rgba(0.2, 0.5, 0.9, alpha)
+
+    def render_line(self, cr, width, height):
+        columns = self._columns(width, height)
+        if columns is None:
+            return
+        step, top, bottom = columns
+        for i, (y_top, y_bottom) in enumerate(zip(top, bottom)):
+            x = i * step
+            cr.line_to(x, y_top)
+            if y_bottom != y_top:
+                cr.line_to(x, y_bottom)
+        self._set_color(cr)
+        cr.set_line_width(1.0)
+        cr.stroke()
+
+    def render_area(self, cr, width, height):
+        columns = self._columns(width, height)
+        if columns is None:
+            return
+        step, top, _bottom = columns
+        cr.move_to(0, height)
+        for i, y in enumerate(top):
+            cr.line_to(i * step, y)
+        cr.line_to((len(top) - 1) * step, height)
+        cr.close_path()
+        self._set_color(cr, 0.35)
+        cr.fill_preserve()
+        self._set_color(cr)
+        cr.set_line_width(1.0)
+        cr.stroke()
+
+def _float(app, element, name):
+    value = element.attrib.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        app.warn(f"Invalid {name} on <canvas>: {value}")
+        return None
+
+def create(app, element):
+    area = Gtk.DrawingArea()
+    capacity = _float(app, element, "capacity") or 10000
+    # ondraw(area, cr, width, height, plot) replaces the built-in line/area renderer
+    area._gtkml_plot = CanvasPlot(
+        app,
+        area,
+        capacity=int(capacity),
+        renderer=element.attrib.get("renderer", "line").lower(),
+        on_draw=app.get_handler(element.attrib.get("ondraw")),
+        y_range=(_float(app, element, "y-min"), _float(app, element, "y-max")),
+    )
+    widget = area
+    return widget
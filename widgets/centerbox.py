@@ -0,0 +1,22 @@
+from gi.repository import Gtk
+
+SLOTS = ("start", "center", "end")
+
+def create(app, element):
+    centerbox = Gtk.CenterBox()
+    if element.attrib.get("orientation", "").lower() == "vertical":
+        centerbox.set_orientation(Gtk.Orientation.VERTICAL)
+
+    # children fill start/center/end in order unless they name a slot="..."
+    order = iter(SLOTS)
+    for child in element:
+        slot = child.attrib.get("slot", "").lower() or next(order, None)
+        if slot not in SLOTS:
+            app.warn(f"<centerbox> has no slot for <{child.tag}>")
+            continue
+        widget = app.create_widget(child)
+        if widget:
+            getattr(centerbox, f"set_{slot}_widget")(widget)
+
+    widget = centerbox
+    return widget
@@ -5,11 +5,7 @@ def create(app, element):
     active = element.attrib.get("active", "false").lower() in ("1", "true", "yes")
     widget = Gtk.CheckButton(label=label)
     widget.set_active(active)
-    if "onclick" in element.attrib and app.logic:
-        func_name = element.attrib["onclick"]
-        handler = getattr(app.logic, func_name, None)
-        if callable(handler):
-            widget.connect("toggled", lambda w: handler(w, w.get_active()))
-        else:
-            app.warn(f"No such handler in logic.py: {func_name}")
+    handler = app.get_handler(element.attrib.get("onclick"), element, widget)
+    if handler:
+        widget.connect("toggled", lambda w: handler(w, w.get_active()))
     return widget
\ No newline at end of file
@@ -0,0 +1,20 @@
+from gi.repository import Gtk
+
+def create(app, element):
+    store, selection = app.create_selection_model(element)
+    widget = Gtk.ColumnView(model=selection)
+    if element.attrib.get("separators", "false").lower() in ("1", "true", "yes"):
+        widget.set_show_row_separators(True)
+        widget.set_show_column_separators(True)
+
+    for col_elem in element.findall("column"):
+        column = Gtk.ColumnViewColumn(
+            title=col_elem.attrib.get("title", ""),
+            factory=app.create_list_factory(list(col_elem)),
+        )
+        column.set_expand(col_elem.attrib.get("expand", "false").lower() in ("1", "true", "yes"))
+        column.set_resizable(col_elem.attrib.get("resizable", "true").lower() in ("1", "true", "yes"))
+        widget.append_column(column)
+
+    app.connect_row_activate(widget, element, store)
+    return widget
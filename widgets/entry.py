@@ -1,7 +1,37 @@
 from gi.repository import Gtk
 
+ATTRIBUTES = {
+    "max-length": "int",
+    "visibility": "bool",
+}
+
 def create(app, element):
     widget = Gtk.Entry()
     if element.text:
         widget.set_placeholder_text(element.text.strip())
-    return widget
\ No newline at end of file
+
+    # oninput: every edit; onchange: committed edits (Enter or focus out); onactivate: Enter
+    oninput = app.get_handler(element.attrib.get("oninput"), element, widget)
+    if oninput:
+        widget.connect("changed", lambda w: oninput(w, w.get_text()))
+
+    onactivate = app.get_handler(element.attrib.get("onactivate"))
+    if onactivate:
+        widget.connect("activate", onactivate)
+
+    onchange = app.get_handler(element.attrib.get("onchange"), element, widget)
+    if onchange:
+        committed = [widget.get_text()]
+
+        def commit(*_args):
+            text = widget.get_text()
+            if text != committed[0]:
+                committed[0] = text
+                onchange(widget, text)
+
+        widget.connect("activate", commit)
+        focus = Gtk.EventControllerFocus()
+        focus.connect("leave", commit)
+        widget.add_controller(focus)
+
+    return widget
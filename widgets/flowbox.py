@@ -0,0 +1,33 @@
+from gi.repository import Gtk
+
+ATTRIBUTES = {
+    "row-spacing": "int",
+    "column-spacing": "int",
+    "homogeneous": "bool",
+    "min-per-line": ("int", "min_children_per_line"),
+    "max-per-line": ("int", "max_children_per_line"),
+}
+
+def create(app, element):
+    flowbox = Gtk.FlowBox()
+    # forms lay fields out with a flowbox; selection is opt-in
+    if element.attrib.get("selectable", "false").lower() in ("1", "true", "yes"):
+        flowbox.set_selection_mode(Gtk.SelectionMode.SINGLE)
+    else:
+        flowbox.set_selection_mode(Gtk.SelectionMode.NONE)
+
+    spacing = element.attrib.get("spacing")
+    if spacing:
+        try:
+            flowbox.set_row_spacing(int(spacing))
+            flowbox.set_column_spacing(int(spacing))
+        except ValueError:
+            app.warn(f"Invalid spacing on <flowbox>: {spacing}")
+
+    for child in element:
+        widget = app.create_widget(child)
+        if widget:
+            flowbox.append(widget)
+
+    widget = flowbox
+    return widget
@@ -4,7 +4,7 @@ def create(app, element):
     label = element.attrib.get("label")
     widget = Gtk.Frame(label=label)
 
-    children = [app.create_widget(child) for child in element if app.create_widget(child)]
+    children = [app.create_widget(child) for child in element]
     children = [c for c in children if c is not None]
 
     if len(children) == 1:
@@ -0,0 +1,46 @@
+from gi.repository import Gtk
+
+ATTRIBUTES = {
+    "row-spacing": "int",
+    "column-spacing": "int",
+    "row-homogeneous": "bool",
+    "column-homogeneous": "bool",
+}
+
+def _int(app, child, name, default):
+    value = child.attrib.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        app.warn(f"Invalid {name} on <{child.tag}>: {value}")
+        return default
+
+def create(app, element):
+    grid = Gtk.Grid()
+    spacing = _int(app, element, "spacing", None)
+    if spacing is not None:
+        grid.set_row_spacing(spacing)
+        grid.set_column_spacing(spacing)
+
+    # children without row/col flow left to right, wrapping after `columns`
+    columns = max(1, _int(app, element, "columns", 1))
+    row = col = 0
+    for child in element:
+        widget = app.create_widget(child)
+        if not widget:
+            continue
+        r = _int(app, child, "row", row)
+        c = _int(app, child, "col", col)
+        width = max(1, _int(app, child, "colspan", 1))
+        height = max(1, _int(app, child, "rowspan", 1))
+        grid.attach(widget, c, r, width, height)
+
+        col = c + width
+        row = r
+        if col >= columns:
+            row, col = r + 1, 0
+
+    widget = grid
+    return widget
@@ -0,0 +1,13 @@
+from gi.repository import Gtk
+
+def create(app, element):
+    store, selection = app.create_selection_model(element)
+    widget = Gtk.GridView(model=selection, factory=app.create_list_factory(list(element)))
+    for attr, setter in (("min-columns", widget.set_min_columns), ("max-columns", widget.set_max_columns)):
+        if attr in element.attrib:
+            try:
+                setter(int(element.attrib[attr]))
+            except ValueError:
+                app.warn(f"<gridview> {attr} must be an integer")
+    app.connect_row_activate(widget, element, store)
+    return widget
@@ -1,102 +1,128 @@
-from gi.repository import Gtk, Gdk, GdkPixbuf
+from gi.repository import Gtk
 import os
+import weakref
 
-def create(app, element):
-    src = element.attrib.get("src")
+def _resolve_path(app, src):
+    # bundled files first: no stat calls, straight from the mmapped .gresource
+    bundle = getattr(app, "bundle", None)
+    if bundle is not None:
+        uri = bundle.lookup(src) or bundle.lookup(os.path.join("assets", src))
+        if uri:
+            return uri
+
+    candidates = []
+
+    if hasattr(app, "app_root"):
+        candidates.append(os.path.join(app.app_root, src))
+        candidates.append(os.path.join(app.app_root, "assets", src))
+
+    candidates.append(os.path.join(os.getcwd(), src))
+    if not os.path.isabs(src):
+        candidates.append(os.path.abspath(src))
+    else:
+        candidates.insert(0, src)
+
+    return next((p for p in candidates if os.path.exists(p)), None)
+
+def _target_size(app, element, path):
     width = element.attrib.get("width")
     height = element.attrib.get("height")
     size = element.attrib.get("size")
 
-    if not src:
-        app.warn("<img> tag missing src attribute.")
-        return Gtk.Image.new()
+    target_w = target_h = None
+    if size:
+        try:
+            target_w = target_h = int(size)
+        except Exception:
+            pass
+    else:
+        if width:
+            try: target_w = int(width)
+            except Exception: pass
+        if height:
+            try: target_h = int(height)
+            except Exception: pass
 
-    try:
-        candidates = []
+    if bool(target_w) != bool(target_h):
+        orig_w, orig_h = app.textures.probe(path)
+        if orig_w and orig_h:
+            if target_w:
+                target_h = int(target_w * (orig_h / orig_w))
+            else:
+                target_w = int(target_h * (orig_w / orig_h))
+        else:
+            target_w = target_h = None
+    return target_w, target_h
 
-        if hasattr(app, "app_root"):
-            candidates.append(os.path.join(app.app_root, src))
-            candidates.append(os.path.join(app.app_root, "assets", src))
+def _create_async(app, path, target_w, target_h):
+    pic = Gtk.Picture()
+    pic.set_content_fit(Gtk.ContentFit.CONTAIN)
+    if target_w and target_h:
+        pic.set_size_request(target_w, target_h)
+        pic.set_halign(Gtk.Align.CENTER)
+        pic.set_valign(Gtk.Align.CENTER)
+    else:
+        # reserve the natural size so the layout does not jump once decoded
+        orig_w, orig_h = app.textures.probe(path)
+        if orig_w and orig_h:
+            pic.set_size_request(orig_w, orig_h)
 
-        candidates.append(os.path.join(os.getcwd(), src))
-        if not os.path.isabs(src):
-            candidates.append(os.path.abspath(src))
-        else:
-            candidates.insert(0, src)
+    # the pending callback must not keep a discarded picture alive
+    pic_ref = weakref.ref(pic)
+
+    def on_loaded(texture):
+        pic = pic_ref()
+        if pic is None:
+            return
+        if texture is not None:
+            pic.set_paintable(texture)
+        if not (target_w and target_h):
+            pic.set_size_request(-1, -1)
+
+    def on_root_changed(widget, _pspec):
+        if widget.get_root() is None:
+            cancel()
+
+    cancel = app.textures.load_async(path, target_w, target_h, on_loaded)
+    pic.connect("unrealize", lambda _w: cancel())
+    pic.connect("notify::root", on_root_changed)
+    return pic
 
-        resolved_path = next((p for p in candidates if os.path.exists(p)), None)
+def create(app, element):
+    src = element.attrib.get("src")
 
+    if not src:
+        app.warn("<img> tag missing src attribute.")
+        return Gtk.Image.new()
+
+    try:
+        resolved_path = _resolve_path(app, src)
         if not resolved_path:
             app.warn(f"Image not found: {src}")
             return Gtk.Image.new()
 
-        target_w = target_h = None
-        if size:
-            try:
-                target_w = target_h = int(size)
-            except Exception:
-                pass
-        else:
-            if width:
-                try: target_w = int(width)
-                except Exception: pass
-            if height:
-                try: target_h = int(height)
-                except Exception: pass
+        target_w, target_h = _target_size(app, element, resolved_path)
+        if element.attrib.get("loading", "").lower() == "async":
+            return _create_async(app, resolved_path, target_w, target_h)
 
         try:
-            orig_pb = GdkPixbuf.Pixbuf.new_from_file(resolved_path)
-            orig_w = orig_pb.get_width()
-            orig_h = orig_pb.get_height()
+            texture = app.textures.load(resolved_path, target_w, target_h)
         except Exception:
-            orig_pb = None
-            orig_w = orig_h = None
-
-        if target_w and not target_h and orig_w and orig_h:
-            target_h = int(target_w * (orig_h / orig_w))
-        elif target_h and not target_w and orig_w and orig_h:
-            target_w = int(target_h * (orig_w / orig_h))
+            if resolved_path.startswith("resource://"):
+                return Gtk.Image.new_from_resource(resolved_path[len("resource://"):])
+            return Gtk.Image.new_from_file(resolved_path)
 
+        pic = Gtk.Picture()
+        pic.set_paintable(texture)
+        pic.set_content_fit(Gtk.ContentFit.CONTAIN)
         if target_w and target_h:
-            try:
-                scaled_pb = GdkPixbuf.Pixbuf.new_from_file_at_size(resolved_path, target_w, target_h)
-            except Exception:
-                if orig_pb:
-                    scaled_pb = orig_pb.scale_simple(target_w, target_h, GdkPixbuf.InterpType.BILINEAR)
-                else:
-                    scaled_pb = None
-
-            if scaled_pb:
-                try:
-                    texture = Gdk.Texture.new_for_pixbuf(scaled_pb)
-                    pic = Gtk.Picture()
-                    pic.set_paintable(texture)
-                    pic.set_size_request(target_w, target_h)
-                    pic.set_content_fit(Gtk.ContentFit.CONTAIN)
-                    pic.set_halign(Gtk.Align.CENTER)
-                    pic.set_valign(Gtk.Align.CENTER)
-                    widget = pic
-                except Exception:
-                    widget = Gtk.Image.new_from_pixbuf(scaled_pb)
-            else:
-                texture = Gdk.Texture.new_from_filename(resolved_path)
-                pic = Gtk.Picture()
-                pic.set_paintable(texture)
-                pic.set_size_request(target_w, target_h)
-                widget = pic
-        else:
-            try:
-                texture = Gdk.Texture.new_from_filename(resolved_path)
-                pic = Gtk.Picture()
-                pic.set_paintable(texture)
-                pic.set_content_fit(Gtk.ContentFit.CONTAIN)
-                widget = pic
-            except Exception:
-                widget = Gtk.Image.new_from_file(resolved_path)
+            pic.set_size_request(target_w, target_h)
+            pic.set_halign(Gtk.Align.CENTER)
+            pic.set_valign(Gtk.Align.CENTER)
+        widget = pic
 
     except Exception as e:
         app.warn(f"Could not load image '{src}': {e}")
         widget = Gtk.Image.new()
 
-    app.apply_common_properties(widget, element.attrib)
-    return widget
\ No newline at end of file
+    return widget
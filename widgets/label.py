@@ -1,5 +1,12 @@
 from gi.repository import Gtk
 
+ATTRIBUTES = {
+    "wrap": "bool",
+    "selectable": "bool",
+    "xalign": "float",
+    "max-chars": ("int", "max_width_chars"),
+}
+
 def create(app, element):
     widget = Gtk.Label(label=(element.text or "").strip())
-    return widget
\ No newline at end of file
+    return widget
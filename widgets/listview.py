@@ -0,0 +1,9 @@
+from gi.repository import Gtk
+
+def create(app, element):
+    store, selection = app.create_selection_model(element)
+    widget = Gtk.ListView(model=selection, factory=app.create_list_factory(list(element)))
+    if element.attrib.get("separators", "false").lower() in ("1", "true", "yes"):
+        widget.set_show_separators(True)
+    app.connect_row_activate(widget, element, store)
+    return widget
@@ -1,15 +1,77 @@
-from gi.repository import Gtk
+from gi.repository import Gtk, GLib
+
+def _truthy(value):
+    return str(value).lower() in ("1", "true", "yes", "on")
+
+def _build_page(app, page, tab_elem, state):
+    if state["built"]:
+        return
+    state["built"] = True
+    for child in tab_elem:
+        child_widget = app.create_widget(child)
+        if child_widget:
+            page.append(child_widget)
+    if state["onload"]:
+        state["onload"](page)
+
+def _release_page(app, page, tab_elem, state):
+    state["timer"] = 0
+    if not state["built"]:
+        return False
+    app.release_subtree(tab_elem, page)
+    child = page.get_first_child()
+    while child is not None:
+        page.remove(child)
+        child = page.get_first_child()
+    state["built"] = False
+    return False
 
 def create(app, element):
     widget = Gtk.Notebook()
+    notebook_lazy = _truthy(element.attrib.get("lazy", "false"))
+    notebook_onload = element.attrib.get("onload")
+    pages = []
+
     for tab_elem in element.findall("tab"):
         label = tab_elem.attrib.get("label", "Tab")
+        lazy = _truthy(tab_elem.attrib.get("lazy", notebook_lazy))
+        try:
+            unload = int(tab_elem.attrib.get("unload", element.attrib.get("unload", 0)))
+        except ValueError:
+            unload = 0
 
+        state = {
+            "built": False,
+            "timer": 0,
+            "unload": unload if lazy else 0,
+            "onload": app.get_handler(tab_elem.attrib.get("onload", notebook_onload)) if lazy else None,
+        }
         vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        for child in tab_elem:
-            child_widget = app.create_widget(child)
-            if child_widget:
-                vbox.append(child_widget)
+        # the first page is visible straight away, so it is never deferred
+        if not lazy or not pages:
+            _build_page(app, vbox, tab_elem, state)
 
+        pages.append((vbox, tab_elem, state))
         widget.append_page(vbox, Gtk.Label(label=label))
+
+    def on_switch_page(_notebook, _page, page_num):
+        for index, (page, tab_elem, state) in enumerate(pages):
+            if index == page_num:
+                if state["timer"]:
+                    GLib.source_remove(state["timer"])
+                    state["timer"] = 0
+                _build_page(app, page, tab_elem, state)
+            elif state["unload"] and state["built"] and not state["timer"]:
+                state["timer"] = GLib.timeout_add_seconds(
+                    state["unload"], _release_page, app, page, tab_elem, state)
+
+    def on_destroy(_notebook):
+        for _, _, state in pages:
+            if state["timer"]:
+                GLib.source_remove(state["timer"])
+                state["timer"] = 0
+
+    if any(not state["built"] or state["unload"] for _, _, state in pages):
+        widget.connect("switch-page", on_switch_page)
+        widget.connect("destroy", on_destroy)
     return widget
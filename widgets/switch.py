@@ -19,11 +19,7 @@ def create(app, element):
         sw.set_active(active)
         widget = sw
 
-    if "onclick" in element.attrib and app.logic:
-        func_name = element.attrib["onclick"]
-        handler = getattr(app.logic, func_name, None)
-        if callable(handler):
-            sw.connect("state-set", lambda w, state: handler(w, state))
-        else:
-            app.warn(f"No such handler in logic.py: {func_name}")
+    handler = app.get_handler(element.attrib.get("onclick"), element, sw)
+    if handler:
+        sw.connect("state-set", lambda w, state: handler(w, state))
     return widget
@@ -1,9 +1,27 @@
 from gi.repository import Gtk
 
+ATTRIBUTES = {
+    "editable": "bool",
+    "monospace": "bool",
+    "cursor-visible": "bool",
+}
+
 def create(app, element):
     textview = Gtk.TextView()
-    buffer = textview.get_buffer()
-    if element.text and element.text.strip():
-        buffer.set_text(element.text.strip())
+    src = element.attrib.get("src")
+    if src:
+        # large files are streamed in chunks instead of one set_text
+        max_lines = element.attrib.get("max-lines")
+        try:
+            max_lines = int(max_lines) if max_lines else None
+        except ValueError:
+            app.warn(f"Invalid max-lines: {max_lines}")
+            max_lines = None
+        follow = element.attrib.get("follow", "").lower() in ("true", "1", "yes")
+        app.load_text(textview, src, follow=follow, max_lines=max_lines)
+    else:
+        buffer = textview.get_buffer()
+        if element.text and element.text.strip():
+            buffer.set_text(element.text.strip())
     widget = textview
-    return widget
\ No newline at end of file
+    return widget